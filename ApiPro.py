@@ -0,0 +1,314 @@
+"""API HTTP en lecture seule sur le catalogue du Tableau Périodique
+
+Sert les éléments, les époques, les valeurs de filtres, les spectres simulés et les tables
+de couleurs à partir des mêmes classes que le dashboard, sans passer par Streamlit.
+
+Lancement local :
+    python ApiPro.py --port 8600
+    curl -H 'Accept-Encoding: gzip' 'http://127.0.0.1:8600/api/elements?categorie=Gaz%20noble'
+"""
+import argparse
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import numpy as np
+
+try:
+    import brotli
+except ImportError:  # compression brotli optionnelle
+    brotli = None
+
+from DashboardPro import (CompletePeriodicTableDashboard, DEFAULT_TEMPERATURE, ELECTRON_FILTERS,
+                          EPOCH_GRANULARITIES, EPOCH_START_YEARS, GRID_COLORINGS, electron_filter_mask)
+
+MAX_PER_PAGE = 200
+MIN_COMPRESSED_SIZE = 512
+# Paramètres reconnus par ressource ; les autres sont ignorés et n'entrent pas dans la clé de cache
+ROUTE_PARAMS = {
+    'version': (),
+    'elements': ('categorie', 'epoque', 'periode', 'groupe', 'structure', 'q', 'page', 'per_page'),
+    'epochs': ('granularite', 'debut'),
+    'filters': (),
+    'spectra': ('temperature',),
+    'colors': ('mode',)
+}
+
+class ApiError(Exception):
+    """Erreur renvoyée au client avec un statut HTTP"""
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class CatalogApi:
+    """Routage et construction des réponses, indépendants du serveur HTTP
+
+    Les corps sont mis en cache par (chemin, requête canonique, encodage) : le catalogue
+    étant immuable pour une version donnée, chaque réponse n'est calculée qu'une fois.
+    """
+
+    def __init__(self, dashboard=None):
+        self.dashboard = dashboard or CompletePeriodicTableDashboard()
+        self.catalog = self.dashboard.catalog
+        self.version = self.dashboard.catalog_version
+        self.routes = {
+            'version': self.get_version,
+            'elements': self.get_elements,
+            'epochs': self.get_epochs,
+            'filters': self.get_filters,
+            'spectra': self.get_spectrum,
+            'colors': self.get_colors
+        }
+
+    @staticmethod
+    def canonical_query(path, query):
+        """Requête canonique : paramètres reconnus de la ressource, triés, dernière valeur retenue"""
+        parts = [part for part in path.split('/') if part]
+        allowed = ROUTE_PARAMS.get(parts[1], ()) if len(parts) > 1 else ()
+        return urlencode(sorted((name, value) for name, value in dict(parse_qsl(query)).items()
+                                if name in allowed))
+
+    def etag(self, path, query, encoding):
+        """ETag forte dérivée de la version du catalogue, de la requête et de l'encodage du corps
+
+        Chaque représentation (gzip, br, identity) a ses propres octets, donc sa propre ETag.
+        """
+        digest = hashlib.sha1(f"{path}?{query}".encode('utf-8')).hexdigest()[:12]
+        return f'"{self.version}-{digest}-{encoding}"'
+
+    @lru_cache(maxsize=4096)
+    def render(self, path, query, encoding):
+        """Retourne (statut, corps encodé) pour un chemin et une requête canonique"""
+        try:
+            status, payload = HTTPStatus.OK, self.dispatch(path, dict(parse_qsl(query)))
+        except ApiError as error:
+            status, payload = error.status, {'erreur': str(error)}
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        if len(body) < MIN_COMPRESSED_SIZE or encoding == 'identity':
+            return status, body, 'identity'
+        if encoding == 'br':
+            return status, brotli.compress(body, quality=5), 'br'
+        return status, gzip.compress(body, compresslevel=6), 'gzip'
+
+    def dispatch(self, path, params):
+        parts = [part for part in path.split('/') if part]
+        if len(parts) < 2 or parts[0] != 'api' or parts[1] not in self.routes or len(parts) > 3:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Ressource inconnue : {path}")
+        return self.routes[parts[1]](params, *parts[2:])
+
+    # Ressources
+
+    def element_payload(self, i):
+        record = self.catalog.elements[i]
+        spectral = self.catalog.spectra.get(record.symbole)
+        rgb = self.dashboard.get_element_rgb(record.symbole)
+        return {
+            'symbole': record.symbole,
+            'nom': record.nom,
+            'numero_atomique': record.numero_atomique,
+            'masse_atomique': record.masse_atomique,
+            'config_electronique': record.config_electronique,
+            'periode': record.periode,
+            'groupe': record.groupe,
+            'categorie': record.categorie,
+            'date_decouverte': record.date_decouverte,
+            'decouvreur': record.decouvreur,
+            'periode_epoch': record.periode_epoch,
+            'electrons_valence': int(self.catalog.valence_electrons[i]),
+            'electrons_non_apparies': int(self.catalog.unpaired_electrons[i]),
+            'rgb': list(rgb),
+            'raies_nm': [raie.longueur_onde for raie in spectral.raies] if spectral else []
+        }
+
+    def element_index(self, symbole):
+        if symbole not in self.catalog.index_by_symbol:
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Élément inconnu : {symbole}")
+        return self.catalog.index_by_symbol[symbole]
+
+    @staticmethod
+    def int_param(params, name, default, minimum=None, maximum=None):
+        try:
+            value = int(params.get(name, default))
+        except ValueError:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Paramètre entier attendu : {name}")
+        if minimum is not None and value < minimum or maximum is not None and value > maximum:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Paramètre hors limites : {name}")
+        return value
+
+    def get_version(self, params):
+        return {'version': self.version, 'elements': len(self.catalog), 'nucleides': len(self.catalog.nuclides)}
+
+    def get_elements(self, params, symbole=None):
+        if symbole is not None:
+            return self.element_payload(self.element_index(symbole))
+
+        mask = np.ones(len(self.catalog), dtype=bool)
+        records = self.catalog.elements
+        if 'categorie' in params:
+            mask &= np.array([e.categorie == params['categorie'] for e in records])
+        if 'epoque' in params:
+            mask &= np.array([e.periode_epoch == params['epoque'] for e in records])
+        if 'periode' in params:
+            mask &= self.catalog.periode == self.int_param(params, 'periode', 0)
+        if 'groupe' in params:
+            mask &= self.catalog.groupe == self.int_param(params, 'groupe', 0)
+        if 'structure' in params:
+            if params['structure'] not in ELECTRON_FILTERS:
+                raise ApiError(HTTPStatus.BAD_REQUEST, f"Filtre électronique inconnu : {params['structure']}")
+            mask &= electron_filter_mask(self.catalog.electron_occupancy, params['structure'])
+        if 'q' in params:
+            found = {e.symbole for e in self.catalog.search_index.search(params['q'], limit=len(records))}
+            mask &= np.array([e.symbole in found for e in records])
+
+        indices = np.flatnonzero(mask)
+        page = self.int_param(params, 'page', 1, minimum=1)
+        per_page = self.int_param(params, 'per_page', 50, minimum=1, maximum=MAX_PER_PAGE)
+        selected = indices[(page - 1) * per_page:page * per_page]
+        return {
+            'total': len(indices),
+            'page': page,
+            'per_page': per_page,
+            'pages': max(1, -(-len(indices) // per_page)),
+            'items': [self.element_payload(i) for i in selected]
+        }
+
+    def get_epochs(self, params):
+        granularity = params.get('granularite', 'Époques historiques')
+        if granularity not in EPOCH_GRANULARITIES:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Granularité inconnue : {granularity}")
+        start_year = self.int_param(params, 'debut', 0, minimum=EPOCH_START_YEARS[0],
+                                    maximum=EPOCH_START_YEARS[1])
+        return [
+            {'nom': epoch.nom, 'periode': epoch.periode, 'couleur': epoch.couleur,
+             'description': epoch.description,
+             'elements': [self.catalog.elements[i].symbole for i in epoch.indices]}
+            for epoch in self.catalog.regroup_epochs(granularity, start_year, skip_empty=True)
+        ]
+
+    def get_filters(self, params):
+        return {
+            'categories': sorted({e.categorie for e in self.catalog.elements}),
+            'epoques': [epoch.nom for epoch in self.catalog.epochs],
+            'structures': list(ELECTRON_FILTERS),
+            'granularites': list(EPOCH_GRANULARITIES),
+            'colorations': GRID_COLORINGS
+        }
+
+    def get_spectrum(self, params, symbole=None):
+        if symbole is None:
+            raise ApiError(HTTPStatus.NOT_FOUND, "Symbole attendu : /api/spectra/<symbole>")
+        self.element_index(symbole)
+        temperatures = self.dashboard.emission_spectra.temperatures
+        temperature = self.int_param(params, 'temperature', DEFAULT_TEMPERATURE,
+                                     minimum=int(temperatures[0]), maximum=int(temperatures[-1]))
+        wavelengths, intensities = self.dashboard.simulate_spectrum(symbole, temperature)
+        return {
+            'symbole': symbole,
+            'temperature_k': int(temperatures[self.dashboard.emission_spectra.temperature_index(temperature)]),
+            'longueur_onde_nm': np.round(wavelengths, 3).tolist(),
+            'intensite': np.round(intensities, 6).tolist()
+        }
+
+    def get_colors(self, params):
+        coloring = params.get('mode', 'Spectre RGB')
+        if coloring not in GRID_COLORINGS:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Mode de coloration inconnu : {coloring}")
+        colors = self.dashboard.grid_colors(coloring)
+        return {
+            'mode': coloring,
+            'couleurs': {
+                record.symbole: '#{:02x}{:02x}{:02x}'.format(*(int(round(c)) for c in rgb))
+                for record, rgb in zip(self.catalog.elements, colors)
+            }
+        }
+
+def negotiate_encoding(accept_encoding):
+    """Choisit brotli, gzip ou identity selon l'en-tête Accept-Encoding"""
+    accepted = {}
+    for item in accept_encoding.split(','):
+        name, _, quality = item.strip().partition(';q=')
+        if name:
+            try:
+                accepted[name.lower()] = float(quality) if quality else 1.0
+            except ValueError:
+                continue
+    if brotli is not None and accepted.get('br', 0) > 0:
+        return 'br'
+    if accepted.get('gzip', 0) > 0:
+        return 'gzip'
+    return 'identity'
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+    """Gestionnaire HTTP/1.1 (connexions persistantes) au-dessus de CatalogApi"""
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # en-têtes et corps envoyés séparément sur une connexion persistante
+    server_version = 'TableauPeriodiqueApi/1.0'
+    api = None
+
+    def do_GET(self):
+        self.respond(send_body=True)
+
+    def do_HEAD(self):
+        self.respond(send_body=False)
+
+    def respond(self, send_body):
+        url = urlsplit(self.path)
+        query = self.api.canonical_query(url.path, url.query)
+        encoding = negotiate_encoding(self.headers.get('Accept-Encoding', ''))
+        # Corps mis en cache : l'ETag porte l'encodage réellement servi (les petits corps restent en identity)
+        status, body, content_encoding = self.api.render(url.path, query, encoding)
+        etag = self.api.etag(url.path, query, content_encoding)
+
+        if_none_match = {tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')}
+        if status == HTTPStatus.OK and etag in if_none_match:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'public, max-age=300')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        if status == HTTPStatus.OK:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'public, max-age=300')
+        if content_encoding != 'identity':
+            self.send_header('Content-Encoding', content_encoding)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def create_server(host='127.0.0.1', port=8600, api=None, verbose=False):
+    """Crée le serveur HTTP (non démarré) ; `api` permet de partager un CatalogApi existant"""
+    handler = type('Handler', (CatalogRequestHandler,), {'api': api or CatalogApi()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="API HTTP en lecture seule du Tableau Périodique")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--verbose', action='store_true', help="Journaliser chaque requête")
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, verbose=args.verbose)
+    print(f"API du catalogue {server.RequestHandlerClass.api.version} sur http://{args.host}:{args.port}/api/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
@@ -1,4 +1,6 @@
 import streamlit as st
+import streamlit.components.v1 as components
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 import pandas as pd
 import numpy as np
 import plotly.express as px
@@ -7,6 +9,25 @@ from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
 import seaborn as sns
 from scipy import constants
+from scipy import sparse
+from scipy import stats
+from scipy.cluster import hierarchy
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import squareform
+import unicodedata
+import asyncio
+import hashlib
+import heapq
+import functools
+import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict, Counter, OrderedDict
+from dataclasses import dataclass, asdict
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -107,47 +128,1611 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+def normalize_search_text(text):
+    """Normalise un texte pour la recherche : minuscules, sans accents (Étain -> etain)"""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    return ''.join(c for c in decomposed if not unicodedata.combining(c)).lower().strip()
+
+class ElementSearchIndex:
+    """Index de recherche préconstruit (préfixes + trigrammes) sur le catalogue des éléments"""
+    FIELD_WEIGHTS = {
+        'symbole': 5.0,
+        'numero_atomique': 4.0,
+        'nom': 3.0,
+        'longueur_onde': 2.0,
+        'decouvreur': 1.5
+    }
+    MIN_SIMILARITY = 0.3
+    RANKED_DEPTH = 32  # résultats préclassés par préfixe fréquent (requêtes d'un seul terme)
+
+    def __init__(self, elements, spectra):
+        self.elements = elements                # enregistrements ElementRecord du catalogue
+        self.prefix_index = defaultdict(dict)   # préfixe -> {indice élément: score}
+        self.trigram_index = defaultdict(list)  # trigramme -> [indice jeton]
+        tokens = []                             # (indice élément, poids, nombre de trigrammes)
+        
+        for idx, element in enumerate(elements):
+            for field, token in self._iter_tokens(element, spectra.get(element.symbole)):
+                self._add_token(tokens, idx, self.FIELD_WEIGHTS[field], token)
+        
+        # Colonnes des jetons et listes de trigrammes figées en tableaux pour le calcul approché
+        self.token_element, self.token_weight, self.token_grams = (np.array(column) for column in zip(*tokens))
+        self.trigram_index = {gram: np.array(ids, dtype=np.int32) for gram, ids in self.trigram_index.items()}
+        
+        # Préfixes fréquents (une ou deux lettres) : classement calculé une fois plutôt qu'à chaque frappe
+        self.ranked_prefixes = {
+            prefix: [idx for idx, _ in self._rank(postings.items(), self.RANKED_DEPTH)]
+            for prefix, postings in self.prefix_index.items() if len(postings) > self.RANKED_DEPTH
+        }
+        self.prefix_index = dict(self.prefix_index)
+    
+    @staticmethod
+    def _iter_tokens(element, spectral_record):
+        """Génère les jetons normalisés (champ, jeton) d'un élément"""
+        yield 'symbole', normalize_search_text(element.symbole)
+        yield 'numero_atomique', str(element.numero_atomique)
+        for token in re.split(r'[\s\-]+', normalize_search_text(element.nom)):
+            if token:
+                yield 'nom', token
+        for token in re.split(r'[\s\-.,()]+', normalize_search_text(element.decouvreur)):
+            if token:
+                yield 'decouvreur', token
+        if spectral_record:
+            for raie in spectral_record.raies:
+                yield 'longueur_onde', f"{raie.longueur_onde:g}"
+    
+    @staticmethod
+    def _trigrams(token):
+        padded = f"  {token} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def _add_token(self, tokens, idx, weight, token):
+        for k in range(1, len(token) + 1):
+            # Une correspondance exacte du jeton vaut le double d'un simple préfixe
+            score = weight * (2.0 if k == len(token) else 1.0 + k / len(token) / 2)
+            prefix = token[:k]
+            if score > self.prefix_index[prefix].get(idx, 0.0):
+                self.prefix_index[prefix][idx] = score
+        
+        grams = self._trigrams(token)
+        for gram in grams:
+            self.trigram_index[gram].append(len(tokens))
+        tokens.append((idx, weight, len(grams)))
+    
+    def _rank(self, scored, limit):
+        """Les `limit` meilleurs (indice, score), à égalité par numéro atomique"""
+        return heapq.nsmallest(limit, scored, key=lambda item: (-item[1], self.elements[item[0]].numero_atomique))
+    
+    def _fuzzy_scores(self, term):
+        """Scores approchés (similarité de Jaccard sur les trigrammes) pour un terme"""
+        grams = self._trigrams(term)
+        postings = [self.trigram_index[gram] for gram in grams if gram in self.trigram_index]
+        if not postings:
+            return {}
+        overlap = np.bincount(np.concatenate(postings))
+        token_ids = np.flatnonzero(overlap)
+        overlap = overlap[token_ids]
+        similarity = overlap / (len(grams) + self.token_grams[token_ids] - overlap)
+        kept = similarity >= self.MIN_SIMILARITY
+        
+        scores = {}
+        for idx, score in zip(self.token_element[token_ids[kept]].tolist(),
+                              (self.token_weight[token_ids[kept]] * similarity[kept]).tolist()):
+            if score > scores.get(idx, 0.0):
+                scores[idx] = score
+        return scores
+    
+    def search(self, query, limit=10):
+        """Retourne les enregistrements du catalogue classés par pertinence pour une requête libre"""
+        terms = [t for t in re.split(r'[\s,;]+', normalize_search_text(query)) if t]
+        if not terms:
+            return []
+        if len(terms) == 1 and limit <= self.RANKED_DEPTH and terms[0] in self.ranked_prefixes:
+            return [self.elements[idx] for idx in self.ranked_prefixes[terms[0]][:limit]]
+        
+        postings = []
+        for term in terms:
+            scores = self.prefix_index.get(term) or self._fuzzy_scores(term)
+            if not scores:
+                return []
+            postings.append(scores)
+        
+        # Tous les termes doivent correspondre : intersection à partir de la plus petite liste
+        smallest = min(postings, key=len)
+        totals = ((idx, sum(scores[idx] for scores in postings)) for idx in smallest
+                  if all(idx in scores for scores in postings))
+        return [self.elements[idx] for idx, _ in self._rank(totals, limit)]
+
+@dataclass(frozen=True, slots=True)
+class ElementRecord:
+    """Enregistrement compact et immuable d'un élément"""
+    symbole: str
+    nom: str
+    numero_atomique: int
+    masse_atomique: float
+    config_electronique: str
+    periode: int
+    groupe: int
+    categorie: str
+    date_decouverte: int
+    decouvreur: str
+    periode_epoch: str
+
+@dataclass(frozen=True, slots=True)
+class SpectralLineRecord:
+    """Raie spectrale : longueur d'onde en nm et annotation éventuelle (ex. Hα)"""
+    longueur_onde: float
+    annotation: str = ''
+
+    @classmethod
+    def parse(cls, raie):
+        """Convertit une raie textuelle ('656.3 nm (Hα)') en enregistrement"""
+        match = re.match(r'\s*(\d+(?:\.\d+)?)\s*nm\s*(?:\((.*)\))?', raie)
+        if match is None:
+            raise ValueError(f"Raie spectrale illisible : {raie!r}")
+        return cls(float(match.group(1)), match.group(2) or '')
+
+    def __str__(self):
+        return f"{self.longueur_onde:.1f} nm" + (f" ({self.annotation})" if self.annotation else '')
+
+@dataclass(frozen=True, slots=True)
+class SpectralRecord:
+    """Données spectrales d'un élément avec longueurs d'onde numériques"""
+    symbole: str
+    rgb: tuple
+    longueur_onde_principale: float
+    raies: tuple
+
+@dataclass(frozen=True, slots=True, eq=False)
+class EpochRecord:
+    """Époque historique ; `indices` référence les éléments du catalogue"""
+    nom: str
+    periode: str
+    couleur: str
+    description: str
+    indices: np.ndarray
+
+EPOCH_GRANULARITIES = {'Époques historiques': None, 'Siècles': 100, 'Décennies': 10}
+EPOCH_START_YEARS = (-3000, 2000)  # bornes de l'année de départ des regroupements réguliers
+MAX_EPOCH_BINS = 512
+
+def bin_discovery_dates(dates, edges):
+    """Classe de chaque date : la classe k couvre [edges[k-1], edges[k])"""
+    return np.searchsorted(edges, dates, side='right')
+
+SUBSHELLS = ('1s', '2s', '2p', '3s', '3p', '4s', '3d', '4p', '5s', '4d',
+             '5p', '6s', '4f', '5d', '6p', '7s', '5f', '6d', '7p')
+SUBSHELL_N = np.array([int(name[0]) for name in SUBSHELLS], dtype=np.int8)
+SUBSHELL_L = np.array(['spdf'.index(name[1]) for name in SUBSHELLS], dtype=np.int8)
+SUBSHELL_CAPACITY = (2 * (2 * SUBSHELL_L + 1)).astype(np.int8)
+SUPERSCRIPT_DIGITS = str.maketrans('⁰¹²³⁴⁵⁶⁷⁸⁹', '0123456789')
+
+def parse_electron_configurations(configurations):
+    """Développe les configurations ('[Ar] 3d¹⁰ 4s²') en matrice d'occupation N x sous-couches
+    
+    `configurations` associe chaque symbole à sa configuration ; les cœurs de gaz noble
+    sont résolus à partir des configurations du même dictionnaire.
+    """
+    column = {name: i for i, name in enumerate(SUBSHELLS)}
+    expanded = {}
+    
+    def expand(symbole):
+        if symbole not in expanded:
+            row = np.zeros(len(SUBSHELLS), dtype=np.int8)
+            for token in configurations[symbole].split():
+                core = re.fullmatch(r'\[(\w+)\]', token)
+                if core:
+                    row += expand(core.group(1))
+                    continue
+                match = re.fullmatch(r'(\d[spdf])(\d+)', token.translate(SUPERSCRIPT_DIGITS))
+                if match is None or match.group(1) not in column:
+                    raise ValueError(f"Configuration électronique illisible pour {symbole} : {token!r}")
+                row[column[match.group(1)]] += int(match.group(2))
+            expanded[symbole] = row
+        return expanded[symbole]
+    
+    return np.stack([expand(symbole) for symbole in configurations])
+
+def core_electron_occupancy(configurations, occupancy):
+    """Occupation du cœur de gaz noble entre crochets de chaque configuration (zéro sans cœur)"""
+    row_by_symbol = {symbole: i for i, symbole in enumerate(configurations)}
+    core = np.zeros_like(occupancy)
+    for i, configuration in enumerate(configurations.values()):
+        match = re.match(r'\s*\[(\w+)\]', configuration)
+        if match:
+            core[i] = occupancy[row_by_symbol[match.group(1)]]
+    return core
+
+def valence_electron_counts(occupancy, core):
+    """Électrons de valence : électrons hors du cœur de gaz noble, sans les sous-couches
+    (n-1)d¹⁰ et (n-2)f¹⁴ complètes (n : couche la plus externe occupée)"""
+    outer_n = np.where(occupancy > 0, SUBSHELL_N, 0).max(axis=1, keepdims=True)
+    full = occupancy == SUBSHELL_CAPACITY
+    filled_inner = (((SUBSHELL_L == 2) & (SUBSHELL_N == outer_n - 1) & full)
+                    | ((SUBSHELL_L == 3) & (SUBSHELL_N == outer_n - 2) & full))
+    return ((occupancy - core) * ~filled_inner).sum(axis=1)
+
+def unpaired_electron_counts(occupancy):
+    """Électrons non appariés selon la règle de Hund, sous-couche par sous-couche"""
+    return np.minimum(occupancy, SUBSHELL_CAPACITY - occupancy).sum(axis=1)
+
+ELECTRON_FILTERS = {
+    'Tous': None,
+    'Couche d demi-remplie (d⁵)': (2, 'half'),
+    'Couche f demi-remplie (f⁷)': (3, 'half'),
+    'Couche d externe complète (d¹⁰)': (2, 'full'),
+    'Couche d partiellement remplie': (2, 'partial'),
+    'Couche f partiellement remplie': (3, 'partial')
+}
+
+def electron_filter_mask(occupancy, filter_name):
+    """Masque des éléments dont la sous-couche externe de type l satisfait le filtre"""
+    rule = ELECTRON_FILTERS[filter_name]
+    if rule is None:
+        return np.ones(len(occupancy), dtype=bool)
+    l, kind = rule
+    shells = occupancy[:, SUBSHELL_L == l]   # colonnes triées par n croissant
+    occupied = shells > 0
+    outermost = np.where(occupied.any(axis=1),
+                         shells[np.arange(len(shells)), shells.shape[1] - 1 - occupied[:, ::-1].argmax(axis=1)],
+                         -1)
+    capacity = 2 * (2 * l + 1)
+    if kind == 'half':
+        return outermost == capacity // 2
+    if kind == 'full':
+        return outermost == capacity
+    return (outermost > 0) & (outermost < capacity)
+
+NUCLIDE_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nuclides.csv')
+
+@st.cache_resource(show_spinner=False)
+def load_nuclide_file(path, mtime):
+    """Lit un fichier de nucléides une seule fois par date de modification"""
+    table = pd.read_csv(path)
+    table = table.astype(object).where(table.notna(), None)
+    return table.to_dict('records')
+
+class NuclideTable:
+    """Table des nucléides en colonnes, triée par (Z, A) et reliée au catalogue par Z"""
+    
+    def __init__(self, nuclides_data, numero_by_symbol):
+        rows = sorted(
+            (row for row in nuclides_data if row['symbole'] in numero_by_symbol),
+            key=lambda row: (numero_by_symbol[row['symbole']], row['nombre_masse'])
+        )
+        self.labels = np.array([f"{row['symbole']}-{row['nombre_masse']}" for row in rows], dtype=object)
+        self.index_by_label = {label: i for i, label in enumerate(self.labels)}
+        
+        self.z = np.array([numero_by_symbol[row['symbole']] for row in rows], dtype=np.int16)
+        self.a = np.array([row['nombre_masse'] for row in rows], dtype=np.int16)
+        self.masse = np.array([row['masse_isotopique'] for row in rows], dtype=np.float64)
+        self.abondance = np.array([row['abondance'] or 0.0 for row in rows], dtype=np.float64) / 100
+        self.demi_vie = np.array([row['demi_vie_s'] or np.inf for row in rows], dtype=np.float64)
+        self.decay_constant = np.log(2) / self.demi_vie  # 0 pour les nucléides stables
+        self.descendant = np.array([self.index_by_label.get(row['descendant'], -1) for row in rows],
+                                   dtype=np.int32)
+        
+        # offsets[z]:offsets[z + 1] délimite les isotopes de l'élément de numéro z
+        self.offsets = np.searchsorted(self.z, np.arange(max(numero_by_symbol.values()) + 2))
+    
+    def __len__(self):
+        return len(self.labels)
+    
+    def for_element(self, numero_atomique):
+        """Indices des isotopes d'un élément (tranche contiguë)"""
+        return np.arange(self.offsets[numero_atomique], self.offsets[numero_atomique + 1])
+    
+    def weighted_masses(self, min_coverage=0.99):
+        """Masse atomique pondérée par les abondances, indexée par Z
+        
+        NaN lorsque les abondances connues d'un élément couvrent moins de `min_coverage`.
+        """
+        n_z = len(self.offsets) - 1
+        total = np.bincount(self.z, weights=self.abondance, minlength=n_z)
+        weighted = np.bincount(self.z, weights=self.abondance * self.masse, minlength=n_z)
+        masses = np.full(n_z, np.nan)
+        np.divide(weighted, total, out=masses, where=total >= min_coverage)
+        return masses
+    
+    def decay_chain(self, label):
+        """Indices de la chaîne de désintégration issue de `label`, jusqu'au premier nucléide stable"""
+        chain = [self.index_by_label[label]]
+        while self.decay_constant[chain[-1]] > 0 and self.descendant[chain[-1]] >= 0:
+            if self.descendant[chain[-1]] in chain:
+                break
+            chain.append(int(self.descendant[chain[-1]]))
+        return np.array(chain)
+    
+    def activity(self, indices, n0, times):
+        """Activité (Bq) de nucléides indépendants : matrice (nucléides x instants)"""
+        lam = self.decay_constant[indices][:, None]
+        return lam * np.asarray(n0, dtype=np.float64).reshape(-1, 1) * np.exp(-lam * times[None, :])
+    
+    def bateman(self, chain, n0, times):
+        """Nombre d'atomes de chaque membre d'une chaîne linéaire (solution de Bateman)
+        
+        Le parent compte `n0` atomes à t = 0 ; retourne une matrice (membres x instants).
+        """
+        lam = self.decay_constant[chain].copy()
+        # La solution analytique suppose des constantes distinctes
+        _, first = np.unique(lam, return_index=True)
+        duplicates = np.setdiff1d(np.arange(len(lam)), first)
+        lam[duplicates] *= 1 + 1e-9 * (duplicates + 1)
+        
+        n = len(lam)
+        diff = lam[None, :] - lam[:, None]      # diff[j, k] = λk - λj
+        np.fill_diagonal(diff, 1.0)
+        denominators = np.cumprod(diff, axis=1)  # [j, m] = Π_{k<=m, k!=j} (λk - λj)
+        numerators = np.concatenate([[1.0], np.cumprod(lam[:-1])])  # [m] = Π_{i<m} λi
+        lower = np.arange(n)[None, :] <= np.arange(n)[:, None]
+        coefficients = np.where(lower, numerators[:, None] / denominators.T, 0.0)
+        
+        atoms = n0 * coefficients @ np.exp(-np.outer(lam, times))
+        # Les termes alternés annulent à ~1e-16 près : les résidus négatifs sont du bruit
+        return np.clip(atoms, 0.0, None)
+
+def format_half_life(seconds):
+    """Formate une demi-vie en secondes dans l'unité la plus lisible"""
+    if not np.isfinite(seconds):
+        return 'Stable'
+    for unit, label in ((constants.Julian_year, 'a'), (constants.day, 'j'), (constants.hour, 'h'),
+                        (constants.minute, 'min'), (1.0, 's')):
+        if seconds >= unit:
+            return f"{seconds / unit:.4g} {label}"
+    return f"{seconds * 1e6:.4g} µs"
+
+@st.cache_data(show_spinner=False)
+def compute_decay_evolution(catalog_version, _catalog, parent, sample_mass, horizon_years, n_times=200):
+    """Activités (Bq) des membres de la chaîne issue de `parent` sur une grille de temps logarithmique"""
+    nuclides = _catalog.nuclides
+    chain = nuclides.decay_chain(parent)
+    n0 = sample_mass / nuclides.masse[chain[0]] * constants.Avogadro
+    times = np.geomspace(1.0, horizon_years * constants.Julian_year, n_times)
+    atoms = nuclides.bateman(chain, n0, times)
+    activities = nuclides.decay_constant[chain][:, None] * atoms
+    return times, list(nuclides.labels[chain]), activities
+
+FORMULA_TOKEN = re.compile(r'\s*(?:([A-Z][a-z]?)|(\d+)|([(\[{])|([)\]}]))')
+FORMULA_CHARGE = re.compile(
+    r'(?:\^\s*(\d*)\s*([+-])|\^\s*([+-])\s*(\d*)|\s+(\d*)([+-])|\((\d*)([+-])\)'
+    r'|(?<=[\]}])(\d+)([+-])|([+-])(\d+)|([+-]+))\s*$'
+)
+HYDRATE_SEPARATORS = re.compile(r'\s*[·•∙.*]\s*')
+
+@functools.lru_cache(maxsize=65536)
+def parse_formula(formula):
+    """Décompose une formule chimique en (((symbole, quantité), ...), charge)
+    
+    Gère les parenthèses et crochets imbriqués, les hydrates (CuSO4·5H2O, CuSO4.5H2O)
+    et les charges (SO4^2-, SO4 2-, SO4(2-), [Fe(CN)6]4-, Fe^3+, Fe+3, Fe+++, Na+, NH4^+).
+    Un chiffre suivi directement du signe final (Fe3+, SO42-, NH4+, I3-) est ambigu entre
+    indice et charge : la formule est rejetée plutôt que de renvoyer une masse fausse.
+    """
+    text = formula.strip()
+    charge = 0
+    match = FORMULA_CHARGE.search(text)
+    if match:
+        groups = match.groups()
+        for digits_index, sign_index in ((0, 1), (3, 2), (4, 5), (6, 7), (8, 9), (11, 10)):
+            if groups[sign_index]:
+                magnitude = int(groups[digits_index]) if groups[digits_index] else 1
+                charge = magnitude if groups[sign_index] == '+' else -magnitude
+                break
+        else:
+            signs = groups[12]
+            if text[:match.start()].endswith(tuple('0123456789')):
+                raise ValueError(f"Charge ambiguë dans {formula!r} : noter la charge avec ^, une espace "
+                                 f"ou des parenthèses (SO4^2-, SO4 2-, SO4(2-), NH4^+)")
+            charge = len(signs) if signs[0] == '+' else -len(signs)
+        text = text[:match.start()]
+    
+    counts = Counter()
+    for part in HYDRATE_SEPARATORS.split(text):
+        coefficient = re.match(r'\s*(\d*)', part)
+        multiplier = int(coefficient.group(1)) if coefficient.group(1) else 1
+        for symbole, quantity in _parse_formula_part(part[coefficient.end():], formula).items():
+            counts[symbole] += multiplier * quantity
+    
+    if not counts:
+        raise ValueError(f"Formule vide : {formula!r}")
+    return tuple(sorted(counts.items())), charge
+
+def _parse_formula_part(text, formula):
+    """Analyse une partie sans hydrate ni charge à l'aide d'une pile de groupes"""
+    stack = [Counter()]
+    openers = []
+    position = 0
+    while position < len(text):
+        token = FORMULA_TOKEN.match(text, position)
+        if token is None:
+            raise ValueError(f"Caractère inattendu dans {formula!r} : {text[position:]!r}")
+        symbole, digits, opening, closing = token.groups()
+        position = token.end()
+        
+        count_match = re.match(r'\d+', text[position:]) if symbole or closing else None
+        count = int(count_match.group()) if count_match else 1
+        if count_match:
+            position += count_match.end()
+        
+        if symbole:
+            stack[-1][symbole] += count
+        elif opening:
+            stack.append(Counter())
+            openers.append(opening)
+        elif closing:
+            if not openers or '([{'.index(openers.pop()) != ')]}'.index(closing):
+                raise ValueError(f"Parenthèses déséquilibrées dans {formula!r}")
+            group = stack.pop()
+            for key, value in group.items():
+                stack[-1][key] += count * value
+        else:
+            raise ValueError(f"Coefficient mal placé dans {formula!r}")
+    if openers:
+        raise ValueError(f"Parenthèses déséquilibrées dans {formula!r}")
+    return stack[0]
+
+class MolarMassCalculator:
+    """Masses molaires et fractions massiques calculées à partir des masses du catalogue"""
+    # Masse molaire de l'électron (g/mol), retranchée pour chaque charge positive
+    ELECTRON_MOLAR_MASS = constants.m_e * constants.Avogadro * 1e3
+    
+    def __init__(self, elements):
+        self.z_by_symbol = {e.symbole: e.numero_atomique for e in elements}
+        self.symbols = np.array([''] * (max(self.z_by_symbol.values()) + 1), dtype=object)
+        self.masses = np.zeros(len(self.symbols))  # indexé par Z
+        for e in elements:
+            self.symbols[e.numero_atomique] = e.symbole
+            self.masses[e.numero_atomique] = e.masse_atomique
+    
+    def composition_matrix(self, formulas):
+        """Matrice creuse (formules x Z) des quantités, charges et erreurs d'analyse"""
+        rows, columns, values = [], [], []
+        charges = np.zeros(len(formulas), dtype=np.int16)
+        errors = [None] * len(formulas)
+        for i, formula in enumerate(formulas):
+            try:
+                composition, charges[i] = parse_formula(str(formula))
+                z = [self.z_by_symbol[symbole] for symbole, _ in composition]
+            except KeyError as error:
+                errors[i] = f"Élément inconnu : {error.args[0]}"
+                continue
+            except ValueError as error:
+                errors[i] = str(error)
+                continue
+            rows.extend([i] * len(z))
+            columns.extend(z)
+            values.extend(quantity for _, quantity in composition)
+        matrix = sparse.csr_matrix((values, (rows, columns)), shape=(len(formulas), len(self.masses)))
+        return matrix, charges, errors
+    
+    def molar_masses(self, formulas):
+        """Masses molaires (g/mol) d'une liste de formules ; NaN pour les formules invalides"""
+        # Chaque formule distincte n'est analysée qu'une fois
+        inverse, unique = pd.factorize(pd.Series(formulas, dtype=object).astype(str))
+        matrix, charges, errors = self.composition_matrix(list(unique))
+        masses = matrix @ self.masses - charges * self.ELECTRON_MOLAR_MASS
+        invalid = np.array([error is not None for error in errors], dtype=bool)
+        masses[invalid] = np.nan
+        return pd.DataFrame({
+            'formule': formulas,
+            'masse_molaire': masses[inverse],
+            'charge': charges[inverse],
+            'erreur': np.array(errors, dtype=object)[inverse]
+        })
+    
+    def mass_fractions(self, formulas):
+        """Fractions massiques de chaque élément présent (une colonne par élément)"""
+        inverse, unique = pd.factorize(pd.Series(formulas, dtype=object).astype(str))
+        matrix, _, errors = self.composition_matrix(list(unique))
+        contributions = matrix.multiply(self.masses[None, :]).tocsr()
+        totals = np.asarray(contributions.sum(axis=1)).ravel()
+        present = np.unique(contributions.indices)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fractions = contributions[:, present].toarray() / totals[:, None]
+        fractions[[error is not None for error in errors]] = np.nan
+        return pd.DataFrame(fractions[inverse], columns=[f"w({s})" for s in self.symbols[present]],
+                            index=formulas)
+    
+    def stream_csv(self, source, column, chunksize=100_000, output=None):
+        """Calcule les masses molaires d'une colonne CSV par blocs, sans tout charger en mémoire
+        
+        Produit chaque bloc enrichi des colonnes `masse_molaire` et `erreur` ; si `output`
+        est fourni, les blocs y sont aussi écrits au fil de l'eau.
+        """
+        for i, chunk in enumerate(pd.read_csv(source, chunksize=chunksize, dtype={column: str})):
+            result = self.molar_masses(chunk[column].fillna('').tolist())
+            chunk['masse_molaire'] = result['masse_molaire'].to_numpy()
+            chunk['erreur'] = result['erreur'].to_numpy()
+            if output is not None:
+                chunk.to_csv(output, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+            yield chunk
+
+def remove_file(path):
+    if os.path.exists(path):
+        os.remove(path)
+
+@st.cache_resource(show_spinner=False, scope='session', max_entries=1, on_release=remove_file)
+def molar_mass_output_file(upload_id, column):
+    """Fichier temporaire des résultats d'un CSV, supprimé avec la session ou au calcul suivant"""
+    fd, path = tempfile.mkstemp(prefix='masses_molaires_', suffix='.csv')
+    os.close(fd)
+    return path
+
+@dataclass(frozen=True, slots=True, eq=False)
+class GridLayout:
+    """Disposition du tableau : coordonnées (colonne, ligne) 1-indexées de chaque élément"""
+    coords: np.ndarray
+    columns: int
+    labels: tuple = ()
+
+def standard_layout(z, periode, groupe):
+    """Tableau à 18 colonnes, lanthanides et actinides sur deux lignes séparées"""
+    coords = np.column_stack([groupe, periode]).astype(np.int16)
+    lanthanides = (z >= 58) & (z <= 71)
+    actinides = (z >= 90) & (z <= 103)
+    coords[lanthanides] = np.column_stack([z[lanthanides] - 55, np.full(lanthanides.sum(), 9)])
+    coords[actinides] = np.column_stack([z[actinides] - 87, np.full(actinides.sum(), 10)])
+    labels = ({'text': 'Lanthanides', 'x': 1, 'y': 9, 'span': 2},
+              {'text': 'Actinides', 'x': 1, 'y': 10, 'span': 2})
+    return GridLayout(coords, 18, labels)
+
+def long_form_layout(z, periode, groupe):
+    """Forme longue à 32 colonnes : le bloc f (La-Yb, Ac-No) s'insère entre les groupes 2 et 3"""
+    columns = np.where(groupe <= 2, groupe, groupe + 14)
+    f_block = (groupe == 3) & (periode >= 6)
+    first = np.where(periode == 6, 57, 89)
+    columns = np.where(f_block, z - first + 3, columns)
+    return GridLayout(np.column_stack([columns, periode]).astype(np.int16), 32)
+
+def spiral_layout(z):
+    """Spirale carrée compacte par numéro atomique croissant, à partir du centre"""
+    n = z.astype(np.int64)
+    ring = np.ceil((np.sqrt(n) - 1) / 2).astype(np.int64)
+    side = 2 * ring
+    corner = (2 * ring + 1) ** 2
+    # Position sur l'anneau, parcourue côté par côté depuis le coin (ring, ring)
+    offset = corner - n
+    x = np.select([offset <= side, offset <= 2 * side, offset <= 3 * side],
+                  [ring - offset, -ring, -ring + (offset - 2 * side)], ring)
+    y = np.select([offset <= side, offset <= 2 * side, offset <= 3 * side],
+                  [-ring, -ring + (offset - side), ring], ring - (offset - 3 * side))
+    coords = np.column_stack([x - x.min() + 1, y - y.min() + 1]).astype(np.int16)
+    return GridLayout(coords, int(coords[:, 0].max()))
+
+def discovery_layout(z, dates, first_decade=1700):
+    """Une colonne par décennie de découverte (non vide), éléments empilés par numéro atomique"""
+    decades = np.where(dates < first_decade, first_decade - 10, dates // 10 * 10)
+    bins, column = np.unique(decades, return_inverse=True)
+    order = np.lexsort((z, column))
+    counts = np.bincount(column)
+    rank = np.empty_like(column)
+    rank[order] = np.arange(len(z)) - np.repeat(np.cumsum(counts) - counts, counts)
+    coords = np.column_stack([column + 1, rank + 2]).astype(np.int16)
+    labels = tuple({'text': f"< {first_decade}" if decade < first_decade else str(decade),
+                    'x': k + 1, 'y': 1, 'vertical': True} for k, decade in enumerate(bins.tolist()))
+    return GridLayout(coords, len(bins), labels)
+
+GRID_LAYOUTS = ['Standard (18 colonnes)', 'Forme longue (32 colonnes)', 'Spirale compacte',
+                'Par décennie de découverte']
+
+class ElementCatalog:
+    """Catalogue immuable (enregistrements, colonnes, index) construit une fois par version"""
+    
+    def __init__(self, elements_data, epochs_data, spectral_data, nuclides_data=()):
+        # Colonnes numériques pour les calculs vectorisés
+        self.numero_atomique = np.array([e['numero_atomique'] for e in elements_data], dtype=np.int16)
+        self.masse_atomique = np.array([e['masse_atomique'] for e in elements_data], dtype=np.float64)
+        self.periode = np.array([e['periode'] for e in elements_data], dtype=np.int8)
+        self.groupe = np.array([e['groupe'] for e in elements_data], dtype=np.int8)
+        self.date_decouverte = np.array([e['date_decouverte'] for e in elements_data], dtype=np.int32)
+        
+        # L'époque de chaque élément est déduite de sa date de découverte
+        self.epochs_meta = epochs_data
+        self.epoch_edges = np.array([epoch['debut'] for epoch in epochs_data[1:]], dtype=np.int32)
+        epoch_index = bin_discovery_dates(self.date_decouverte, self.epoch_edges)
+        
+        self.elements = tuple(
+            ElementRecord(**{**element, 'periode_epoch': epochs_data[k]['nom']})
+            for element, k in zip(elements_data, epoch_index)
+        )
+        self.index_by_symbol = {e.symbole: i for i, e in enumerate(self.elements)}
+        
+        self.spectra = {
+            symbole: SpectralRecord(
+                symbole=symbole,
+                rgb=tuple(info['rgb']),
+                longueur_onde_principale=float(info['longueur_onde_principale']),
+                raies=tuple(SpectralLineRecord.parse(raie) for raie in info['raies'])
+            )
+            for symbole, info in spectral_data.items()
+        }
+        
+        # Configurations électroniques développées une seule fois
+        configurations = {e.symbole: e.config_electronique for e in self.elements}
+        self.electron_occupancy = parse_electron_configurations(configurations)
+        self.valence_electrons = valence_electron_counts(
+            self.electron_occupancy, core_electron_occupancy(configurations, self.electron_occupancy))
+        self.unpaired_electrons = unpaired_electron_counts(self.electron_occupancy)
+        
+        self.epochs = self.regroup_epochs()
+        self.labels = tuple(f"{e.symbole} - {e.nom}" for e in self.elements)
+        self.search_index = ElementSearchIndex(self.elements, self.spectra)
+        self.formula_calculator = MolarMassCalculator(self.elements)
+        self.nuclides = NuclideTable(nuclides_data, {e.symbole: e.numero_atomique for e in self.elements})
+        
+        # Dispositions du tableau calculées une fois : changer de disposition est une simple lecture
+        z = self.numero_atomique.astype(np.int64)
+        self.layouts = dict(zip(GRID_LAYOUTS, (
+            standard_layout(z, self.periode, self.groupe),
+            long_form_layout(z, self.periode, self.groupe),
+            spiral_layout(z),
+            discovery_layout(z, self.date_decouverte)
+        )))
+    
+    def regroup_epochs(self, granularity='Époques historiques', start_year=0, skip_empty=False):
+        """Regroupe les éléments par classes de dates (époques historiques, siècles, décennies)"""
+        step = EPOCH_GRANULARITIES[granularity]
+        if step is None:
+            edges = self.epoch_edges
+            meta = [(e['nom'], e['periode'], e['couleur'], e['description']) for e in self.epochs_meta]
+        else:
+            first = step * (start_year // step)
+            last = max(step * (int(self.date_decouverte.max()) // step + 1), first + step)
+            # Nombre de classes plafonné : les dates plus anciennes tombent dans « Avant … »
+            first = max(first, last - step * MAX_EPOCH_BINS)
+            edges = np.arange(first, last + 1, step)
+            palette = px.colors.sample_colorscale('YlOrBr', np.linspace(0.15, 0.95, len(edges) + 1))
+            meta = [(f"Avant {first}", f"< {first}", palette[0], f"Éléments découverts avant {first}")]
+            for k in range(1, len(edges)):
+                start, end = edges[k - 1], edges[k] - 1
+                meta.append((f"{start}-{end}", f"{start}-{end}", palette[k],
+                             f"Éléments découverts entre {start} et {end}"))
+            meta.append((f"Depuis {last}", f">= {last}", palette[-1], f"Éléments découverts depuis {last}"))
+        
+        bins = bin_discovery_dates(self.date_decouverte, edges)
+        order = np.argsort(bins, kind='stable').astype(np.int16)
+        bounds = np.searchsorted(bins[order], np.arange(len(edges) + 2))
+        
+        epochs = []
+        for k, (nom, periode, couleur, description) in enumerate(meta):
+            indices = order[bounds[k]:bounds[k + 1]]
+            if skip_empty and len(indices) == 0:
+                continue
+            epochs.append(EpochRecord(nom=nom, periode=periode, couleur=couleur,
+                                      description=description, indices=indices))
+        return tuple(epochs)
+    
+    def grid_coordinates(self, layout=GRID_LAYOUTS[0]):
+        """Coordonnées (colonne, ligne) de chaque élément dans une disposition du tableau"""
+        return self.layouts[layout].coords.astype(np.float64)
+    
+    def __len__(self):
+        return len(self.elements)
+
+def data_file_mtimes():
+    """Dates de modification des fichiers qui définissent le catalogue (ce script, nuclides.csv)"""
+    return tuple(os.stat(path).st_mtime_ns if os.path.exists(path) else None
+                 for path in (os.path.abspath(__file__), NUCLIDE_DATA_FILE))
+
+@st.cache_resource(show_spinner=False)
+def catalog_fingerprint(data_mtimes, _elements_data, _epochs_data, _spectral_data, _nuclides_data):
+    """Empreinte du catalogue, sérialisée et hachée une fois par état des fichiers de données"""
+    payload = json.dumps([_elements_data, _epochs_data, _spectral_data, _nuclides_data],
+                         sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:12]
+
+@st.cache_resource(show_spinner=False)
+def load_catalog(catalog_version, _elements_data, _epochs_data, _spectral_data, _nuclides_data):
+    """Construit le catalogue une seule fois par version"""
+    return ElementCatalog(_elements_data, _epochs_data, _spectral_data, _nuclides_data)
+
+SPECTRUM_WAVELENGTHS = np.linspace(380, 780, 2001)
+SPECTRUM_TEMPERATURES = np.arange(2000, 12001, 250)
+DEFAULT_TEMPERATURE = 6000
+INSTRUMENT_FWHM_NM = 2.0
+
+def emission_line_profiles(line_wavelengths, line_masses, temperatures, wavelengths):
+    """Profils d'émission (température × raie × longueur d'onde) en une seule diffusion
+
+    Chaque raie est traitée comme une raie de résonance : le niveau supérieur est à
+    l'énergie du photon E = hc/λ au-dessus du fondamental, peuplé selon Boltzmann
+    (exp(-E/kT), poids statistiques et probabilités de transition non disponibles donc égaux).
+    La largeur Doppler σ = λ·√(kT/mc²) est combinée en quadrature avec la résolution
+    instrumentale, sans laquelle les raies (≈ 0,01 nm) seraient invisibles à cette échelle.
+    """
+    lam0 = line_wavelengths[None, :, None]
+    temperature = temperatures[:, None, None]
+    energy = constants.h * constants.c / (lam0 * constants.nano)
+    population = np.exp(-energy / (constants.k * temperature))
+    doppler = lam0 * np.sqrt(constants.k * temperature
+                             / (line_masses[None, :, None] * constants.atomic_mass * constants.c ** 2))
+    instrument = INSTRUMENT_FWHM_NM / (2 * np.sqrt(2 * np.log(2)))
+    sigma = np.sqrt(doppler ** 2 + instrument ** 2)
+    profile = np.exp(-0.5 * ((wavelengths[None, None, :] - lam0) / sigma) ** 2) / (sigma * np.sqrt(2 * np.pi))
+    return energy * population * profile
+
+class EmissionSpectra:
+    """Spectres d'émission précalculés de tout le catalogue sur la grille des températures"""
+
+    def __init__(self, catalog, temperatures=SPECTRUM_TEMPERATURES, wavelengths=SPECTRUM_WAVELENGTHS):
+        self.temperatures = temperatures
+        self.wavelengths = wavelengths
+        symbols = [symbole for symbole, record in catalog.spectra.items() if record.raies]
+        self.index_by_symbol = {symbole: k for k, symbole in enumerate(symbols)}
+
+        # Raies rangées par élément : reduceat somme les raies contiguës de chaque élément
+        lines = [(raie.longueur_onde, catalog.elements[catalog.index_by_symbol[symbole]].masse_atomique)
+                 for symbole in symbols for raie in catalog.spectra[symbole].raies]
+        line_wavelengths, line_masses = np.array(lines, dtype=np.float64).T
+        starts = np.cumsum([0] + [len(catalog.spectra[symbole].raies) for symbole in symbols[:-1]])
+
+        profiles = emission_line_profiles(line_wavelengths, line_masses, temperatures, wavelengths)
+        intensities = np.add.reduceat(profiles, starts, axis=1)
+        # Normalisation par élément sur toute la grille : l'intensité croît avec la température
+        peak = intensities.max(axis=(0, 2), keepdims=True)
+        self.intensities = (intensities / np.where(peak > 0, peak, 1)).astype(np.float32)
+        self.zeros = np.zeros_like(wavelengths, dtype=np.float32)
+
+    def temperature_index(self, temperature):
+        """Indice de la température de la grille la plus proche"""
+        return int(np.abs(self.temperatures - temperature).argmin())
+
+    def spectrum(self, symbole, temperature=DEFAULT_TEMPERATURE):
+        """Spectre (longueurs d'onde, intensités) : simple lecture dans la grille précalculée"""
+        k = self.index_by_symbol.get(symbole)
+        if k is None:
+            return self.wavelengths, self.zeros
+        return self.wavelengths, self.intensities[self.temperature_index(temperature), k]
+
+@st.cache_resource(show_spinner=False)
+def load_emission_spectra(catalog_version, _catalog):
+    """Construit la grille des spectres d'émission une seule fois par version du catalogue"""
+    return EmissionSpectra(_catalog)
+
+SIMILARITY_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.spectral_cache')
+
+def blocked_cosine_similarity(spectra, out, block_size=1024):
+    """Similarité cosinus de toutes les paires de spectres, bloc par bloc
+
+    Seuls des blocs (block_size × block_size) sont matérialisés ; `out` peut être un
+    tableau projeté en mémoire (memmap) pour des bibliothèques plus grandes que la RAM.
+    """
+    norms = np.linalg.norm(spectra, axis=1)
+    norms[norms == 0] = 1
+    n = len(spectra)
+    for i in range(0, n, block_size):
+        block_i = (spectra[i:i + block_size] / norms[i:i + block_size, None]).astype(np.float32)
+        for j in range(i, n, block_size):
+            block_j = (spectra[j:j + block_size] / norms[j:j + block_size, None]).astype(np.float32)
+            similarity = block_i @ block_j.T
+            out[i:i + block_size, j:j + block_size] = similarity
+            out[j:j + block_size, i:i + block_size] = similarity.T
+    return out
+
+def prune_similarity_cache(catalog_version, temperature_index, keep):
+    """Supprime les matrices d'autres versions du catalogue ou d'un modèle périmé à cette température"""
+    for name in os.listdir(SIMILARITY_CACHE_DIR):
+        if name == keep or not (name.startswith('similarite_') and name.endswith('.npy')):
+            continue
+        parts = name[:-len('.npy')].split('_')
+        if parts[1] != catalog_version or parts[2] == str(temperature_index):
+            remove_file(os.path.join(SIMILARITY_CACHE_DIR, name))
+
+@st.cache_resource(show_spinner=False)
+def load_spectral_similarity(catalog_version, temperature_index, _emission_spectra):
+    """Matrice de similarité (float32) des spectres à une température, mise en cache sur disque
+
+    Retourne (symboles, matrice projetée en lecture seule) : la matrice n'est jamais chargée
+    entière, seules les lignes ou sous-matrices lues sont ramenées en mémoire.
+    """
+    # Les spectres sans raie dans le domaine visible n'ont pas de similarité définie
+    spectra = _emission_spectra.intensities[temperature_index]
+    visible = np.flatnonzero(spectra.any(axis=1))
+    symbols = [list(_emission_spectra.index_by_symbol)[k] for k in visible]
+    # Le nom porte une empreinte des spectres modélisés : changer la grille de longueurs d'onde,
+    # la largeur instrumentale ou le modèle d'émission invalide le fichier
+    model_hash = hashlib.sha1(spectra.tobytes()).hexdigest()[:12]
+    path = os.path.join(SIMILARITY_CACHE_DIR,
+                        f"similarite_{catalog_version}_{temperature_index}_{model_hash}.npy")
+    if not os.path.exists(path):
+        os.makedirs(SIMILARITY_CACHE_DIR, exist_ok=True)
+        prune_similarity_cache(catalog_version, temperature_index, os.path.basename(path))
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.float32,
+                                        shape=(len(symbols), len(symbols)))
+        blocked_cosine_similarity(spectra[visible], out)
+        out.flush()
+        del out
+        os.replace(tmp_path, path)
+    return symbols, np.load(path, mmap_mode='r')
+
+def most_similar(similarity, index, k=5):
+    """Indices et scores des k spectres les plus proches de la ligne `index` (hors elle-même)"""
+    row = np.array(similarity[index], dtype=np.float32)
+    row[index] = -np.inf
+    k = min(k, len(row) - 1)
+    candidates = np.argpartition(-row, k - 1)[:k]
+    candidates = candidates[np.argsort(-row[candidates])]
+    return candidates, row[candidates]
+
+MAX_CLUSTERED_SPECTRA = 150
+
+def similarity_neighbourhood(similarity, index, size=MAX_CLUSTERED_SPECTRA):
+    """Sous-ensemble borné à regrouper : tous les spectres s'ils sont peu nombreux, sinon
+    la ligne `index` et ses plus proches voisins (une seule ligne lue sur la matrice projetée)"""
+    if len(similarity) <= size:
+        return np.arange(len(similarity))
+    neighbours, _ = most_similar(similarity, index, size - 1)
+    return np.sort(np.append(neighbours, index))
+
+def clustered_order(similarity, subset):
+    """Ordre des feuilles du regroupement hiérarchique (liaison moyenne, distance 1 - similarité)
+    d'un sous-ensemble ; seule la sous-matrice correspondante est chargée"""
+    if len(subset) < 2:
+        return np.arange(len(subset))
+    distance = np.clip(1 - np.asarray(similarity[np.ix_(subset, subset)], dtype=np.float64), 0, None)
+    np.fill_diagonal(distance, 0)
+    return hierarchy.leaves_list(hierarchy.linkage(squareform(distance, checks=False), method='average'))
+
+def deep_getsizeof(obj, seen=None):
+    """Taille mémoire récursive d'un objet (conteneurs, slots et tableaux NumPy inclus)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) if obj.base is None else sys.getsizeof(obj) + obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(obj.memory_usage(deep=True).sum())
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_getsizeof(k, seen) + deep_getsizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_getsizeof(item, seen) for item in obj)
+    elif hasattr(obj, '__slots__'):
+        size += sum(deep_getsizeof(getattr(obj, name), seen) for name in obj.__slots__ if hasattr(obj, name))
+    elif hasattr(obj, '__dict__') and not isinstance(obj, type):
+        # Objets ordinaires (figures Plotly notamment) : attributs d'instance
+        size += deep_getsizeof(vars(obj), seen)
+    return size
+
+def synthesize_element_dicts(elements_data, n_records):
+    """Génère `n_records` éléments synthétiques (dicts) à partir du catalogue réel"""
+    synthetic = []
+    for i in range(n_records):
+        base = elements_data[i % len(elements_data)]
+        element = dict(base)
+        element['numero_atomique'] = i + 1
+        element['masse_atomique'] = base['masse_atomique'] + i * 1e-3
+        element['nom'] = f"{base['nom']} {i}"
+        element['date_decouverte'] = base['date_decouverte'] + i % 7
+        synthetic.append(element)
+    return synthetic
+
+@st.cache_data(show_spinner=False)
+def compare_record_memory(catalog_version, _catalog, sizes=(118, 100_000)):
+    """Compare l'empreinte mémoire des dicts et des enregistrements à slots"""
+    elements_data = [asdict(record) for record in _catalog.elements]
+    rows = []
+    for n_records in sizes:
+        dicts = synthesize_element_dicts(elements_data, n_records)
+        records = [ElementRecord(**element) for element in dicts]
+        
+        dict_bytes = deep_getsizeof(dicts)
+        record_bytes = deep_getsizeof(records)
+        rows.append({
+            'Enregistrements': n_records,
+            'Conteneur dict (o)': sys.getsizeof(dicts[0]),
+            'Conteneur slots (o)': sys.getsizeof(records[0]),
+            'Total dicts (Mo)': dict_bytes / 1e6,
+            'Total slots (Mo)': record_bytes / 1e6,
+            'Gain': f"{(1 - record_bytes / dict_bytes):.0%}"
+        })
+    return pd.DataFrame(rows)
+
+SESSION_CACHE_BUDGET = 16 * 2**20
+SESSION_CACHE_GLOBAL_BUDGET = 256 * 2**20
+SHARED_CACHE_BUDGET = 64 * 2**20
+SESSION_IDLE_SECONDS = 10 * 60
+
+class ByteBudgetCache:
+    """Cache LRU dont la taille totale (en octets estimés) est bornée"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.entries = OrderedDict()
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry
+
+    def pop_oldest(self):
+        key, (value, nbytes) = self.entries.popitem(last=False)
+        self.nbytes -= nbytes
+        return key, value, nbytes
+
+    def put(self, key, value, nbytes):
+        """Insère une entrée et retourne celles évincées pour respecter le budget"""
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[1]
+        if nbytes > self.budget:
+            return [(key, value, nbytes)]
+        self.entries[key] = (value, nbytes)
+        self.nbytes += nbytes
+        evicted = []
+        while self.nbytes > self.budget:
+            evicted.append(self.pop_oldest())
+        return evicted
+
+class SessionCacheRegistry:
+    """Caches par session (figures, sélections) bornés en octets
+
+    - budget par session : LRU, les entrées évincées sont déversées dans le cache partagé ;
+    - sessions inactives depuis `idle_seconds` : leur cache est libéré ;
+    - plafond global : les entrées les plus anciennes des sessions les moins récemment
+      actives sont déversées dans le cache partagé, lui-même borné.
+    Les clés décrivent le contenu (version du catalogue, paramètres) : une entrée déversée
+    reste réutilisable par toutes les sessions.
+    """
+
+    def __init__(self, session_budget=SESSION_CACHE_BUDGET, global_budget=SESSION_CACHE_GLOBAL_BUDGET,
+                 shared_budget=SHARED_CACHE_BUDGET, idle_seconds=SESSION_IDLE_SECONDS):
+        self.session_budget = session_budget
+        self.global_budget = global_budget
+        self.idle_seconds = idle_seconds
+        self.sessions = {}
+        self.last_access = {}
+        self.hits = Counter()
+        self.misses = Counter()
+        self.shared = ByteBudgetCache(shared_budget)
+        self.lock = threading.Lock()
+
+    def get_or_build(self, session_id, key, builder):
+        with self.lock:
+            now = time.monotonic()
+            self.evict_idle(now)
+            self.last_access[session_id] = now
+            cache = self.sessions.setdefault(session_id, ByteBudgetCache(self.session_budget))
+            entry = cache.get(key) or self.shared.get(key)
+            if entry is not None:
+                self.hits[session_id] += 1
+                return entry[0]
+            self.misses[session_id] += 1
+
+        # Construction hors verrou : les autres sessions ne sont pas bloquées
+        value = builder()
+        nbytes = deep_getsizeof(value)
+        with self.lock:
+            cache = self.sessions.setdefault(session_id, ByteBudgetCache(self.session_budget))
+            for spilled in cache.put(key, value, nbytes):
+                self.shared.put(*spilled)
+            self.enforce_global_budget()
+        return value
+
+    def evict_idle(self, now):
+        for session_id in [s for s, t in self.last_access.items() if now - t > self.idle_seconds]:
+            self.sessions.pop(session_id, None)
+            self.hits.pop(session_id, None)
+            self.misses.pop(session_id, None)
+            del self.last_access[session_id]
+
+    def enforce_global_budget(self):
+        total = sum(cache.nbytes for cache in self.sessions.values())
+        by_idleness = sorted(self.sessions, key=self.last_access.get)
+        for session_id in by_idleness:
+            cache = self.sessions[session_id]
+            while total > self.global_budget and len(cache):
+                key, value, nbytes = cache.pop_oldest()
+                self.shared.put(key, value, nbytes)
+                total -= nbytes
+            if total <= self.global_budget:
+                break
+
+    def report(self):
+        """Empreinte de chaque session et du cache partagé"""
+        with self.lock:
+            now = time.monotonic()
+            rows = [{
+                'Session': session_id[:8],
+                'Entrées': len(cache),
+                'Mémoire (Mo)': cache.nbytes / 2**20,
+                'Inactive depuis (s)': int(now - self.last_access[session_id]),
+                'Succès': self.hits[session_id],
+                'Échecs': self.misses[session_id]
+            } for session_id, cache in self.sessions.items()]
+            rows.append({'Session': 'partagé', 'Entrées': len(self.shared),
+                         'Mémoire (Mo)': self.shared.nbytes / 2**20})
+        columns = ['Session', 'Entrées', 'Mémoire (Mo)', 'Inactive depuis (s)', 'Succès', 'Échecs']
+        return pd.DataFrame(rows, columns=columns).astype(
+            {'Inactive depuis (s)': 'Int64', 'Succès': 'Int64', 'Échecs': 'Int64'})
+
+@st.cache_resource(show_spinner=False)
+def session_cache_registry():
+    """Registre unique du processus, partagé par toutes les sessions"""
+    return SessionCacheRegistry()
+
+def session_cached(key, builder):
+    """Valeur mise en cache pour la session courante (ou dans le cache partagé), construite au besoin"""
+    ctx = get_script_run_ctx()
+    session_id = ctx.session_id if ctx is not None else 'local'
+    return session_cache_registry().get_or_build(session_id, key, builder)
+
+TIMELINE_MIN_YEAR = -3000
+
+@st.cache_data(show_spinner=False)
+def build_discovery_animation(catalog_version, _catalog, _colors):
+    """Figure animée des découvertes cumulées (tableau + frise) avec images précalculées"""
+    # Index trié par date : l'image de l'année X est un préfixe de cet ordre
+    order = np.argsort(_catalog.date_decouverte, kind='stable')
+    dates = _catalog.date_decouverte[order]
+    coords = _catalog.grid_coordinates()[order]
+    numbers = _catalog.numero_atomique[order].tolist()
+    symbols = [_catalog.elements[i].symbole for i in order]
+    colors = [_colors[i] for i in order]
+    hover = [f"{_catalog.elements[i].nom} ({_catalog.elements[i].date_decouverte})" for i in order]
+    timeline_x = np.maximum(dates, TIMELINE_MIN_YEAR).tolist()
+    grid_x, grid_y = coords[:, 0].tolist(), coords[:, 1].tolist()
+    
+    years = np.unique(dates)
+    counts = np.searchsorted(dates, years, side='right')
+    
+    def frame_traces(k):
+        return [
+            go.Scatter(x=grid_x[:k], y=grid_y[:k], text=symbols[:k], hovertext=hover[:k],
+                       marker=dict(color=colors[:k])),
+            go.Scatter(x=timeline_x[:k], y=numbers[:k], text=symbols[:k], hovertext=hover[:k],
+                       marker=dict(color=colors[:k]))
+        ]
+    
+    fig = make_subplots(rows=2, cols=1, row_heights=[0.6, 0.4], vertical_spacing=0.08,
+                        subplot_titles=("Éléments découverts", "Chronologie cumulée"))
+    
+    # Trace 0 : cases encore inconnues (fond fixe)
+    fig.add_trace(go.Scatter(x=grid_x, y=grid_y, text=symbols, mode='markers+text', hoverinfo='skip',
+                             marker=dict(symbol='square', size=26, color='#EEEEEE'),
+                             textfont=dict(color='#BBBBBB', size=10)), row=1, col=1)
+    # Traces 1 et 2 : découvertes cumulées, mises à jour par les images
+    grid_trace, timeline_trace = frame_traces(len(dates))
+    grid_trace.update(mode='markers+text', hoverinfo='text', textfont=dict(size=10),
+                      marker=dict(symbol='square', size=26, line=dict(width=1, color='DarkSlateGrey')))
+    timeline_trace.update(mode='markers', hoverinfo='text',
+                          marker=dict(size=8, line=dict(width=1, color='DarkSlateGrey')))
+    fig.add_trace(grid_trace, row=1, col=1)
+    fig.add_trace(timeline_trace, row=2, col=1)
+    
+    fig.frames = [go.Frame(name=str(year), data=frame_traces(k), traces=[1, 2])
+                  for year, k in zip(years.tolist(), counts.tolist())]
+    
+    play_args = dict(frame=dict(duration=150, redraw=False), transition=dict(duration=0), fromcurrent=True)
+    fig.update_layout(
+        height=800,
+        showlegend=False,
+        updatemenus=[dict(
+            type='buttons', direction='left', x=0, y=-0.06, xanchor='left', yanchor='top',
+            buttons=[
+                dict(label='▶ Lecture', method='animate', args=[None, play_args]),
+                dict(label='⏸ Pause', method='animate',
+                     args=[[None], dict(frame=dict(duration=0, redraw=False), mode='immediate')])
+            ]
+        )],
+        sliders=[dict(
+            active=len(years) - 1, x=0.12, y=-0.04, len=0.88,
+            currentvalue=dict(prefix="Découvertes jusqu'en "),
+            steps=[dict(label=str(year), method='animate',
+                        args=[[str(year)], dict(frame=dict(duration=0, redraw=False), mode='immediate')])
+                   for year in years.tolist()]
+        )]
+    )
+    fig.update_xaxes(range=[0.3, 18.7], visible=False, row=1, col=1)
+    fig.update_yaxes(range=[10.7, 0.3], visible=False, row=1, col=1)
+    fig.update_xaxes(title_text="Année de Découverte", range=[TIMELINE_MIN_YEAR - 100, int(dates.max()) + 50],
+                     row=2, col=1)
+    fig.update_yaxes(title_text="Numéro Atomique", row=2, col=1)
+    return fig
+
+# Grille périodique interactive rendue côté navigateur
+periodic_grid = components.declare_component(
+    "periodic_grid",
+    path=os.path.join(os.path.dirname(os.path.abspath(__file__)), "periodic_grid_component")
+)
+
+GRID_COLORINGS = ['Spectre RGB', 'Électrons de valence', 'Électrons non appariés']
+
+@st.cache_data(show_spinner=False)
+def build_grid_payload(payload_version, _catalog, _colors, _layout=GRID_LAYOUTS[0]):
+    """Sérialise une seule fois le catalogue nécessaire à la grille interactive (JSON)
+
+    Les filtres actifs n'en font pas partie : ils sont transmis à part pour que le
+    navigateur ne reconstruise pas la grille (ni ne perde la sélection) à chaque filtre.
+    """
+    layout = _catalog.layouts[_layout]
+    coords = layout.coords
+    elements = []
+    for i, (record, (x, y), rgb) in enumerate(zip(_catalog.elements, coords.tolist(), _colors)):
+        rgb = [int(round(channel)) for channel in rgb]
+        elements.append({
+            's': record.symbole, 'n': record.nom, 'z': record.numero_atomique,
+            'm': record.masse_atomique, 'c': record.config_electronique,
+            'cat': record.categorie, 'ep': record.periode_epoch, 'd': record.date_decouverte,
+            'dec': record.decouvreur, 'g': record.groupe, 'p': record.periode,
+            'val': int(_catalog.valence_electrons[i]), 'unp': int(_catalog.unpaired_electrons[i]),
+            'x': x, 'y': y,
+            'rgb': f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}',
+            'txt': 'white' if sum(rgb) < 450 else 'black'
+        })
+    return json.dumps({'columns': layout.columns, 'elements': elements, 'labels': list(layout.labels)},
+                      ensure_ascii=False)
+
+def open_in_explorer():
+    """Rappel de la grille : ouvre l'élément demandé dans l'explorateur"""
+    value = st.session_state.get('periodic_grid')
+    if value:
+        st.session_state['explorer_element'] = value['symbole']
+        st.session_state['section'] = "Explorateur d'Éléments"
+
+DESCRIPTOR_FEATURES = ['Masse atomique', 'Période', 'Groupe', 'Électrons de valence',
+                       'Électrons non appariés', "Longueur d'onde principale (nm)", 'Année de découverte',
+                       'Rouge', 'Vert', 'Bleu']
+
+def element_descriptors(catalog, colors):
+    """Matrice des descripteurs (éléments × DESCRIPTOR_FEATURES), non normalisée
+
+    Les longueurs d'onde manquantes valent NaN ; les dates préhistoriques sont ramenées
+    à TIMELINE_MIN_YEAR pour ne pas écraser l'échelle des découvertes modernes.
+    """
+    wavelengths = np.array([catalog.spectra[e.symbole].longueur_onde_principale if e.symbole in catalog.spectra
+                            else np.nan for e in catalog.elements])
+    return np.column_stack([
+        catalog.masse_atomique, catalog.periode, catalog.groupe,
+        catalog.valence_electrons, catalog.unpaired_electrons, wavelengths,
+        np.maximum(catalog.date_decouverte, TIMELINE_MIN_YEAR),
+        np.asarray(colors, dtype=np.float64)
+    ]).astype(np.float64)
+
+class DescriptorIndex:
+    """Index KD-tree de vecteurs descripteurs centrés-réduits (k plus proches voisins, rayon)
+
+    Indépendant des éléments : toute matrice (isotopes, composés, 100k lignes et plus)
+    peut être indexée. Les valeurs manquantes sont remplacées par la moyenne de la colonne.
+    """
+
+    def __init__(self, features, leafsize=16):
+        features = np.array(features, dtype=np.float64)
+        means = np.nanmean(features, axis=0)
+        features = np.where(np.isnan(features), means, features)
+        scales = features.std(axis=0)
+        self.means = means
+        self.scales = np.where(scales > 0, scales, 1)
+        self.vectors = (features - self.means) / self.scales
+        self.tree = cKDTree(self.vectors, leafsize=leafsize)
+
+    def __len__(self):
+        return len(self.vectors)
+
+    def nearest(self, index, k=5):
+        """k voisins les plus proches de la ligne `index` (elle-même exclue) et leurs distances"""
+        distances, indices = self.tree.query(self.vectors[index], k=min(k + 1, len(self)))
+        keep = indices != index
+        return indices[keep][:k], distances[keep][:k]
+
+    def within(self, index, radius):
+        """Lignes à une distance au plus `radius` de la ligne `index`, triées par distance"""
+        indices = np.array(self.tree.query_ball_point(self.vectors[index], radius), dtype=np.int64)
+        indices = indices[indices != index]
+        distances = np.linalg.norm(self.vectors[indices] - self.vectors[index], axis=1)
+        order = np.argsort(distances, kind='stable')
+        return indices[order], distances[order]
+
+@st.cache_resource(show_spinner=False)
+def load_descriptor_index(catalog_version, _catalog, _colors):
+    """Index des descripteurs, reconstruit uniquement quand la version du catalogue change"""
+    return DescriptorIndex(element_descriptors(_catalog, _colors))
+
+TREND_PROPERTIES = {'Masse atomique': 'masse_atomique', 'Année de découverte': 'date_decouverte'}
+TREND_GROUPINGS = {'Groupe': 'groupe', 'Période': 'periode'}
+TREND_OUTLIER_THRESHOLD = 2.0
+
+def grouped_matrix(keys, values):
+    """Range des valeurs en matrice (clés × effectif maximal) complétée par NaN
+
+    Retourne aussi les coordonnées (ligne, colonne) de chaque valeur d'origine pour
+    redistribuer un résultat matriciel élément par élément.
+    """
+    labels, inverse = np.unique(keys, return_inverse=True)
+    counts = np.bincount(inverse)
+    order = np.argsort(inverse, kind='stable')
+    cols = np.empty_like(inverse)
+    cols[order] = np.arange(len(keys)) - np.repeat(np.cumsum(counts) - counts, counts)
+    matrix = np.full((len(labels), counts.max()), np.nan)
+    matrix[inverse, cols] = values
+    return labels, matrix, (inverse, cols)
+
+def batched_trend_fits(x, y):
+    """Régressions linéaires et corrélations de Spearman ligne par ligne (NaN ignorés)"""
+    valid = ~np.isnan(y)
+    n = valid.sum(axis=1)
+    x_mean = np.nanmean(x, axis=1, keepdims=True)
+    y_mean = np.nanmean(y, axis=1, keepdims=True)
+    dx, dy = x - x_mean, y - y_mean
+    sxx = np.nansum(dx ** 2, axis=1)
+    syy = np.nansum(dy ** 2, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = np.where(sxx > 0, np.nansum(dx * dy, axis=1) / sxx, np.nan)
+        intercept = y_mean[:, 0] - slope * x_mean[:, 0]
+        residuals = y - (intercept[:, None] + slope[:, None] * x)
+        ssr = np.nansum(residuals ** 2, axis=1)
+        r2 = np.where(syy > 0, 1 - ssr / syy, np.nan)
+        sigma = np.sqrt(np.where(n > 2, ssr / (n - 2), np.nan))
+        standardized = residuals / sigma[:, None]
+
+        # Spearman = Pearson sur les rangs (rangs moyens en cas d'égalité)
+        rank_x = stats.rankdata(x, axis=1, nan_policy='omit')
+        rank_y = stats.rankdata(y, axis=1, nan_policy='omit')
+        rx = rank_x - np.nanmean(rank_x, axis=1, keepdims=True)
+        ry = rank_y - np.nanmean(rank_y, axis=1, keepdims=True)
+        rho = np.nansum(rx * ry, axis=1) / np.sqrt(np.nansum(rx ** 2, axis=1) * np.nansum(ry ** 2, axis=1))
+        t = rho * np.sqrt((n - 2) / np.clip(1 - rho ** 2, 1e-12, None))
+        p_value = np.where(n > 2, 2 * stats.t.sf(np.abs(t), np.maximum(n - 2, 1)), np.nan)
+    return {'n': n, 'pente': slope, 'ordonnee': intercept, 'r2': r2, 'sigma': sigma,
+            'spearman': rho, 'p_valeur': p_value, 'residus': residuals, 'residus_std': standardized}
+
+@st.cache_data(show_spinner=False)
+def compute_property_trends(catalog_version, filter_key, _catalog, _active, property_name, grouping_name):
+    """Tendances d'une propriété en fonction de Z, par groupe ou par période, sur les éléments filtrés
+
+    Retourne le résumé par clé de regroupement (avec une ligne globale « Tous ») et le
+    détail par élément (valeur ajustée, résidus, valeurs aberrantes).
+    """
+    indices = np.flatnonzero(_active)
+    x = _catalog.numero_atomique[indices].astype(np.float64)
+    y = getattr(_catalog, TREND_PROPERTIES[property_name])[indices].astype(np.float64)
+    keys = getattr(_catalog, TREND_GROUPINGS[grouping_name])[indices]
+
+    labels, y_matrix, (rows, cols) = grouped_matrix(keys, y)
+    x_matrix = np.full_like(y_matrix, np.nan)
+    x_matrix[rows, cols] = x
+
+    # Une ligne supplémentaire pour l'ajustement global : un seul appel pour tous les groupes
+    width = max(y_matrix.shape[1], len(indices))
+    y_all = np.full((len(labels) + 1, width), np.nan)
+    x_all = np.full_like(y_all, np.nan)
+    y_all[:-1, :y_matrix.shape[1]], x_all[:-1, :x_matrix.shape[1]] = y_matrix, x_matrix
+    y_all[-1, :len(indices)], x_all[-1, :len(indices)] = y, x
+    fits = batched_trend_fits(x_all, y_all)
+
+    summary = pd.DataFrame({
+        grouping_name: [str(label) for label in labels] + ['Tous'],
+        'Éléments': fits['n'],
+        'Pente (/Z)': fits['pente'],
+        'Ordonnée': fits['ordonnee'],
+        'R²': fits['r2'],
+        'Spearman ρ': fits['spearman'],
+        'p-valeur': fits['p_valeur']
+    })
+
+    details = pd.DataFrame({
+        'symbole': [_catalog.elements[i].symbole for i in indices],
+        'numero_atomique': x.astype(int),
+        grouping_name: keys.astype(int),
+        'valeur': y,
+        'ajustement': y - fits['residus'][rows, cols],
+        'residu': fits['residus'][rows, cols],
+        'residu_std': fits['residus_std'][rows, cols]
+    })
+    details['aberrant'] = np.abs(details['residu_std']) > TREND_OUTLIER_THRESHOLD
+    return summary, details
+
+def build_trend_figure(details, property_name, grouping_name):
+    """Nuage propriété / Z avec une droite d'ajustement par groupe ou période"""
+    details_sorted = details.sort_values('numero_atomique')
+    fig = px.scatter(details_sorted, x='numero_atomique', y='valeur',
+                     color=details_sorted[grouping_name].astype(str), hover_name='symbole',
+                     labels={'numero_atomique': 'Numéro atomique', 'valeur': property_name,
+                             'color': grouping_name})
+    for key, points in details_sorted.groupby(grouping_name):
+        if len(points) > 1:
+            fig.add_trace(go.Scatter(x=points['numero_atomique'], y=points['ajustement'],
+                                     mode='lines', line=dict(width=1, dash='dot'),
+                                     name=f"Ajustement {key}", showlegend=False))
+    fig.update_layout(height=500, title=f"{property_name} en fonction du numéro atomique")
+    return fig
+
+LIVE_BUFFER_FRAMES = 256
+LIVE_LINE_LIMIT = 1 << 20
+LIVE_POLL_INTERVAL = 0.05
+LIVE_DISPLAY_POINTS = 400
+LIVE_MAX_REFRESH_HZ = 5
+LIVE_SIMULATOR_HZ = 10
+LIVE_SIMULATOR_MAX_BYTES = 4_000_000
+
+class SpectrumRingBuffer:
+    """Tampon circulaire de trames préalloué : la mémoire ne dépend pas de la durée d'acquisition"""
+
+    def __init__(self, capacity, width):
+        self.frames = np.zeros((capacity, width), dtype=np.float32)
+        self.timestamps = np.zeros(capacity)
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def push(self, frame, timestamp):
+        with self.lock:
+            k = self.count % len(self.frames)
+            self.frames[k] = frame
+            self.timestamps[k] = timestamp
+            self.count += 1
+
+    def latest(self, n=1):
+        """Copie des n dernières trames (de la plus ancienne à la plus récente) et de leurs dates"""
+        with self.lock:
+            n = min(n, self.count, len(self.frames))
+            indices = (self.count - n + np.arange(n)) % len(self.frames)
+            return self.frames[indices].copy(), self.timestamps[indices].copy()
+
+def parse_intensity_frame(line, wavelengths):
+    """Trame texte (intensités séparées par des espaces ou des virgules, domaine visible
+    échantillonné uniformément) ramenée sur la grille des longueurs d'onde"""
+    values = np.array(line.replace(',', ' ').split(), dtype=np.float32)
+    if len(values) < 2:
+        raise ValueError("Trame vide")
+    if len(values) != len(wavelengths):
+        values = np.interp(wavelengths, np.linspace(wavelengths[0], wavelengths[-1], len(values)), values)
+    return values
+
+def decimate_spectrum(wavelengths, intensities, n_points=LIVE_DISPLAY_POINTS):
+    """Réduit un spectre à n_points par blocs, en gardant le maximum de chaque bloc (raies préservées)"""
+    factor = max(1, -(-len(intensities) // n_points))
+    usable = len(intensities) // factor * factor
+    return (wavelengths[:usable].reshape(-1, factor).mean(axis=1),
+            intensities[:usable].reshape(-1, factor).max(axis=1))
+
+async def simulate_spectrometer(path, emission_spectra, symbole, rate_hz=LIVE_SIMULATOR_HZ, n_points=500):
+    """Simulateur local : ajoute au fichier des trames bruitées du spectre d'un élément
+
+    Le fichier est tronqué au-delà de LIVE_SIMULATOR_MAX_BYTES, comme une rotation de journal.
+    """
+    rng = np.random.default_rng()
+    wavelengths, clean = emission_spectra.spectrum(symbole)
+    grid = np.linspace(wavelengths[0], wavelengths[-1], n_points)
+    base = np.interp(grid, wavelengths, clean)
+    k = 0
+    while True:
+        frame = base * (1 + 0.2 * np.sin(k / 10)) + rng.normal(0, 0.01, n_points)
+        mode = 'w' if os.path.getsize(path) > LIVE_SIMULATOR_MAX_BYTES else 'a'
+        with open(path, mode) as f:
+            f.write(' '.join(f'{value:.4f}' for value in frame) + '\n')
+        k += 1
+        await asyncio.sleep(1 / rate_hz)
+
+class LiveSpectrumSource:
+    """Acquisition asynchrone de trames d'intensité dans une boucle asyncio dédiée
+
+    Sources : 'tcp://hôte:port', 'unix:///chemin', 'fifo:///chemin' (tube nommé),
+    'file:///chemin' (fichier qui grossit, lu comme tail -F) ou 'simulateur'. Le fil du
+    script Streamlit ne fait que lire le tampon circulaire.
+    """
+
+    def __init__(self, uri, emission_spectra, match=False, simulated_symbol='H',
+                 capacity=LIVE_BUFFER_FRAMES):
+        self.uri = uri
+        self.emission_spectra = emission_spectra
+        self.wavelengths = emission_spectra.wavelengths
+        self.buffer = SpectrumRingBuffer(capacity, len(self.wavelengths))
+        self.match = match
+        self.simulated_symbol = simulated_symbol
+        self.status = "Connexion…"
+        self.errors = 0
+        self.last_match = None
+
+        # Références normalisées : un produit matrice-vecteur par trame
+        references = emission_spectra.intensities[emission_spectra.temperature_index(DEFAULT_TEMPERATURE)]
+        norms = np.linalg.norm(references, axis=1, keepdims=True)
+        self.references = references / np.where(norms > 0, norms, 1)
+        self.reference_symbols = list(emission_spectra.index_by_symbol)
+
+        # Tâche créée avant le démarrage du fil : un stop() immédiat l'annule toujours
+        self.loop = asyncio.new_event_loop()
+        self.task = self.loop.create_task(self.ingest())
+        self.thread = threading.Thread(target=self.run, name=f"spectrometre {uri}", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.task)
+        except asyncio.CancelledError:
+            self.status = "Déconnecté"
+        except (OSError, ValueError) as error:
+            self.status = f"Erreur : {error}"
+        finally:
+            self.loop.close()
+
+    def stop(self):
+        """Arrête l'acquisition depuis n'importe quel fil"""
+        try:
+            self.loop.call_soon_threadsafe(self.task.cancel)
+        except RuntimeError:
+            pass  # boucle déjà fermée : l'acquisition est terminée
+
+    async def ingest(self):
+        scheme, _, target = self.uri.partition('://')
+        if self.uri == 'simulateur':
+            fd, path = tempfile.mkstemp(prefix='spectrometre_', suffix='.txt')
+            os.close(fd)
+            simulator = asyncio.ensure_future(
+                simulate_spectrometer(path, self.emission_spectra, self.simulated_symbol))
+            try:
+                await self.follow_file(path)
+            finally:
+                # Le simulateur doit avoir fini d'écrire avant la suppression du fichier et la fermeture de la boucle
+                simulator.cancel()
+                await asyncio.gather(simulator, return_exceptions=True)
+                os.remove(path)
+        elif scheme == 'tcp':
+            host, _, port = target.rpartition(':')
+            reader, writer = await asyncio.open_connection(host or '127.0.0.1', int(port), limit=LIVE_LINE_LIMIT)
+            await self.consume(reader, writer)
+        elif scheme == 'unix':
+            reader, writer = await asyncio.open_unix_connection(target, limit=LIVE_LINE_LIMIT)
+            await self.consume(reader, writer)
+        elif scheme == 'fifo':
+            # Ouverture non bloquante : le tube peut ne pas encore avoir d'écrivain
+            pipe = os.fdopen(os.open(target, os.O_RDONLY | os.O_NONBLOCK), 'rb', buffering=0)
+            reader = asyncio.StreamReader(limit=LIVE_LINE_LIMIT)
+            await self.loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), pipe)
+            await self.consume(reader)
+        elif scheme == 'file':
+            await self.follow_file(target)
+        else:
+            raise ValueError(f"Source inconnue : {self.uri}")
+        self.status = "Flux terminé"
+
+    async def consume(self, reader, writer=None):
+        self.status = "Connecté"
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Ligne plus longue que LIVE_LINE_LIMIT : ignorée, le tampon du lecteur est vidé
+                    self.errors += 1
+                    continue
+                if not line:
+                    return
+                self.handle(line.decode('utf-8', errors='replace'))
+        finally:
+            if writer is not None:
+                writer.close()
+
+    async def follow_file(self, path):
+        """Lit les lignes ajoutées à un fichier ; reprend au début s'il est tronqué"""
+        self.status = "Connecté"
+        partial = ''
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            f.seek(0, os.SEEK_END)
+            while True:
+                line = f.readline(LIVE_LINE_LIMIT)
+                if line.endswith('\n'):
+                    self.handle(partial + line)
+                    partial = ''
+                elif line:
+                    partial = line if len(partial) + len(line) > LIVE_LINE_LIMIT else partial + line
+                else:
+                    if os.path.getsize(path) < f.tell():
+                        f.seek(0)
+                        partial = ''
+                    await asyncio.sleep(LIVE_POLL_INTERVAL)
+
+    def handle(self, line):
+        try:
+            frame = parse_intensity_frame(line, self.wavelengths)
+        except ValueError:
+            self.errors += 1
+            return
+        self.buffer.push(frame, time.time())
+        if self.match:
+            self.last_match = self.identify(frame)
+
+    def identify(self, frame):
+        """Élément et score cosinus de la référence la plus proche de la trame"""
+        norm = np.linalg.norm(frame)
+        if norm == 0:
+            return None
+        scores = self.references @ (frame / norm)
+        best = int(scores.argmax())
+        return self.reference_symbols[best], float(scores[best])
+
+def configured_live_sources():
+    """Sources d'acquisition autorisées par le serveur : {libellé: uri}
+
+    Seules les sources déclarées côté serveur sont proposées (table [spectrometres] de
+    .streamlit/secrets.toml ou variable SPECTROMETRES='Banc 1=tcp://hôte:port,...'), plus le
+    simulateur local : un navigateur ne peut pas faire ouvrir un socket ou lire un fichier arbitraire.
+    """
+    sources = {'Simulateur local': 'simulateur'}
+    for item in os.environ.get('SPECTROMETRES', '').split(','):
+        label, _, uri = item.partition('=')
+        if label.strip() and uri.strip():
+            sources[label.strip()] = uri.strip()
+    try:
+        sources.update({str(label): str(uri) for label, uri in st.secrets.get('spectrometres', {}).items()})
+    except FileNotFoundError:
+        pass  # pas de secrets.toml
+    return sources
+
+@st.cache_resource(show_spinner=False, scope='session', max_entries=1, on_release=LiveSpectrumSource.stop)
+def open_live_source(uri, match, simulated_symbol, catalog_version, _emission_spectra):
+    """Une acquisition par session, arrêtée quand la session se termine ou change de source"""
+    return LiveSpectrumSource(uri, _emission_spectra, match, simulated_symbol)
+
+def render_live_spectrum(connection, emission_spectra):
+    """Fragment rafraîchi périodiquement : seul le graphique est redessiné, pas la page"""
+    source = open_live_source(*connection, emission_spectra)
+    frames, timestamps = source.buffer.latest(32)
+    if len(frames) == 0:
+        st.info(f"{source.status} - en attente de trames de {source.uri}")
+        return
+
+    wavelengths, intensities = decimate_spectrum(source.wavelengths, frames[-1])
+    fig = go.Figure(go.Scatter(x=wavelengths, y=intensities, mode='lines',
+                               line=dict(color='#8B4513', width=2)))
+    fig.update_layout(title="Spectre mesuré (dernière trame)", xaxis=dict(title="Longueur d'onde (nm)"),
+                      yaxis=dict(title="Intensité"), height=300, margin=dict(t=40, b=40))
+    st.plotly_chart(fig, use_container_width=True)
+
+    rate = (len(timestamps) - 1) / (timestamps[-1] - timestamps[0]) if len(timestamps) > 1 and timestamps[-1] > timestamps[0] else 0
+    caption = f"{source.status} · {source.buffer.count} trames reçues · {rate:.1f} trames/s · {source.errors} rejetées"
+    if source.last_match is not None:
+        symbole, score = source.last_match
+        caption += f" · identification : {symbole} (cosinus {score:.2f})"
+    st.caption(caption)
+
 class CompletePeriodicTableDashboard:
     def __init__(self):
-        self.elements_data = self.define_complete_elements_data()
-        self.epochs_data = self.define_historical_epochs()
-        self.spectral_data = self.define_complete_spectral_rgb_data()
-        
+        # Les dictionnaires sources ne servent qu'à construire (une fois par version) le catalogue
+        # d'enregistrements ; les vues ne lisent que le catalogue
+        sources = (self.define_complete_elements_data(), self.define_historical_epochs(),
+                   self.define_complete_spectral_rgb_data(), self.define_nuclide_data())
+        self.catalog_version = catalog_fingerprint(data_file_mtimes(), *sources)
+        self.catalog = load_catalog(self.catalog_version, *sources)
+        self.search_index = self.catalog.search_index
+        self.symbols = tuple(e.symbole for e in self.catalog.elements)
+        self.emission_spectra = load_emission_spectra(self.catalog_version, self.catalog)
+
     def define_historical_epochs(self):
-        """Définit les périodes historiques de découverte"""
+        """Définit les périodes historiques de découverte ; `debut` est la première année incluse"""
         return [
             {
-                'nom': 'Antiquité', 'periode': 'Avant 500', 'couleur': '#F5DEB3',
-                'description': 'Éléments connus depuis l\'antiquité',
-                'elements': ['H', 'C', 'N', 'O', 'S', 'Cu', 'Ag', 'Sn', 'Sb', 'Au', 'Hg', 'Pb', 'Bi']
+                'nom': 'Antiquité', 'periode': 'Avant 500', 'couleur': '#F5DEB3', 'debut': None,
+                'description': 'Éléments connus depuis l\'antiquité'
             },
             {
-                'nom': 'Moyen-Âge', 'periode': '500-1500', 'couleur': '#DEB887',
-                'description': 'Éléments découverts au Moyen-Âge',
-                'elements': ['As', 'Zn', 'P']
+                'nom': 'Moyen-Âge', 'periode': '500-1500', 'couleur': '#DEB887', 'debut': 500,
+                'description': 'Éléments découverts au Moyen-Âge'
             },
             {
-                'nom': 'Renaissance', 'periode': '1500-1700', 'couleur': '#F4A460',
-                'description': 'Découvertes de la Renaissance et Âge des Lumières',
-                'elements': ['Co', 'Ni', 'Pt']
+                'nom': 'Renaissance', 'periode': '1500-1700', 'couleur': '#F4A460', 'debut': 1500,
+                'description': 'Découvertes de la Renaissance et Âge des Lumières'
             },
             {
-                'nom': 'Révolution Chimique', 'periode': '1700-1800', 'couleur': '#CD853F',
-                'description': 'Période de la révolution chimique',
-                'elements': ['Cl', 'Mn', 'Mo', 'Te', 'Cr', 'W', 'U', 'Ti', 'Be', 'Zr', 'Y', 'Ce']
+                'nom': 'Révolution Chimique', 'periode': '1700-1800', 'couleur': '#CD853F', 'debut': 1700,
+                'description': 'Période de la révolution chimique'
             },
             {
-                'nom': 'Ère Spectroscopique', 'periode': '1800-1900', 'couleur': '#D2691E',
-                'description': 'Découvertes par spectroscopie et électrolyse',
-                'elements': ['Li', 'Na', 'K', 'Rb', 'Cs', 'Ca', 'Sr', 'Ba', 'B', 'Al', 'Si', 'Se', 'Br', 'I', 
-                           'He', 'Ne', 'Ar', 'Kr', 'Xe', 'Mg', 'Sc', 'V', 'Ga', 'Ge', 'Cd', 'In', 'F']
+                'nom': 'Ère Spectroscopique', 'periode': '1800-1900', 'couleur': '#D2691E', 'debut': 1800,
+                'description': 'Découvertes par spectroscopie et électrolyse'
             },
             {
-                'nom': 'Période Moderne', 'periode': '1900-Aujourd\'hui', 'couleur': '#A0522D',
-                'description': 'Éléments découverts au 20ème siècle',
-                'elements': ['Ra', 'Rn', 'Fr', 'Tc', 'Pm', 'Po', 'At', 'Ac', 'Pa', 'Np', 'Pu', 'Am', 'Cm', 
-                           'Bk', 'Cf', 'Es', 'Fm', 'Md', 'No', 'Lr', 'Rf', 'Db', 'Sg', 'Bh', 'Hs', 'Mt', 
-                           'Ds', 'Rg', 'Cn', 'Nh', 'Fl', 'Mc', 'Lv', 'Ts', 'Og']
+                'nom': 'Période Moderne', 'periode': '1900-Aujourd\'hui', 'couleur': '#A0522D', 'debut': 1900,
+                'description': 'Éléments découverts au 20ème siècle'
             }
         ]
     
@@ -157,370 +1742,370 @@ class CompletePeriodicTableDashboard:
             # Période 1
             {'symbole': 'H', 'nom': 'Hydrogène', 'numero_atomique': 1, 'masse_atomique': 1.008,
              'config_electronique': '1s¹', 'periode': 1, 'groupe': 1, 'categorie': 'Non-metal',
-             'date_decouverte': 1766, 'decouvreur': 'Henry Cavendish', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1766, 'decouvreur': 'Henry Cavendish'},
             {'symbole': 'He', 'nom': 'Hélium', 'numero_atomique': 2, 'masse_atomique': 4.0026,
              'config_electronique': '1s²', 'periode': 1, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1868, 'decouvreur': 'Pierre Janssen', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1868, 'decouvreur': 'Pierre Janssen'},
             
             # Période 2
             {'symbole': 'Li', 'nom': 'Lithium', 'numero_atomique': 3, 'masse_atomique': 6.94,
              'config_electronique': '[He] 2s¹', 'periode': 2, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1817, 'decouvreur': 'Johan Arfwedson', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1817, 'decouvreur': 'Johan Arfwedson'},
             {'symbole': 'Be', 'nom': 'Béryllium', 'numero_atomique': 4, 'masse_atomique': 9.0122,
              'config_electronique': '[He] 2s²', 'periode': 2, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1798, 'decouvreur': 'Louis Vauquelin', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1798, 'decouvreur': 'Louis Vauquelin'},
             {'symbole': 'B', 'nom': 'Bore', 'numero_atomique': 5, 'masse_atomique': 10.81,
              'config_electronique': '[He] 2s² 2p¹', 'periode': 2, 'groupe': 13, 'categorie': 'Métalloïde',
-             'date_decouverte': 1808, 'decouvreur': 'Joseph Gay-Lussac', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1808, 'decouvreur': 'Joseph Gay-Lussac'},
             {'symbole': 'C', 'nom': 'Carbone', 'numero_atomique': 6, 'masse_atomique': 12.011,
              'config_electronique': '[He] 2s² 2p²', 'periode': 2, 'groupe': 14, 'categorie': 'Non-metal',
-             'date_decouverte': -25000, 'decouvreur': 'Préhistoire', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -25000, 'decouvreur': 'Préhistoire'},
             {'symbole': 'N', 'nom': 'Azote', 'numero_atomique': 7, 'masse_atomique': 14.007,
              'config_electronique': '[He] 2s² 2p³', 'periode': 2, 'groupe': 15, 'categorie': 'Non-metal',
-             'date_decouverte': 1772, 'decouvreur': 'Daniel Rutherford', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1772, 'decouvreur': 'Daniel Rutherford'},
             {'symbole': 'O', 'nom': 'Oxygène', 'numero_atomique': 8, 'masse_atomique': 15.999,
              'config_electronique': '[He] 2s² 2p⁴', 'periode': 2, 'groupe': 16, 'categorie': 'Non-metal',
-             'date_decouverte': 1774, 'decouvreur': 'Joseph Priestley', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1774, 'decouvreur': 'Joseph Priestley'},
             {'symbole': 'F', 'nom': 'Fluor', 'numero_atomique': 9, 'masse_atomique': 18.998,
              'config_electronique': '[He] 2s² 2p⁵', 'periode': 2, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 1886, 'decouvreur': 'Henri Moissan', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1886, 'decouvreur': 'Henri Moissan'},
             {'symbole': 'Ne', 'nom': 'Néon', 'numero_atomique': 10, 'masse_atomique': 20.18,
              'config_electronique': '[He] 2s² 2p⁶', 'periode': 2, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1898, 'decouvreur': 'William Ramsay', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1898, 'decouvreur': 'William Ramsay'},
             
             # Période 3
             {'symbole': 'Na', 'nom': 'Sodium', 'numero_atomique': 11, 'masse_atomique': 22.99,
              'config_electronique': '[Ne] 3s¹', 'periode': 3, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1807, 'decouvreur': 'Humphry Davy', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1807, 'decouvreur': 'Humphry Davy'},
             {'symbole': 'Mg', 'nom': 'Magnésium', 'numero_atomique': 12, 'masse_atomique': 24.305,
              'config_electronique': '[Ne] 3s²', 'periode': 3, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy'},
             {'symbole': 'Al', 'nom': 'Aluminium', 'numero_atomique': 13, 'masse_atomique': 26.982,
              'config_electronique': '[Ne] 3s² 3p¹', 'periode': 3, 'groupe': 13, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1825, 'decouvreur': 'Hans Christian Ørsted', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1825, 'decouvreur': 'Hans Christian Ørsted'},
             {'symbole': 'Si', 'nom': 'Silicium', 'numero_atomique': 14, 'masse_atomique': 28.085,
              'config_electronique': '[Ne] 3s² 3p²', 'periode': 3, 'groupe': 14, 'categorie': 'Métalloïde',
-             'date_decouverte': 1824, 'decouvreur': 'Jöns Berzelius', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1824, 'decouvreur': 'Jöns Berzelius'},
             {'symbole': 'P', 'nom': 'Phosphore', 'numero_atomique': 15, 'masse_atomique': 30.974,
              'config_electronique': '[Ne] 3s² 3p³', 'periode': 3, 'groupe': 15, 'categorie': 'Non-metal',
-             'date_decouverte': 1669, 'decouvreur': 'Hennig Brand', 'periode_epoch': 'Renaissance'},
+             'date_decouverte': 1669, 'decouvreur': 'Hennig Brand'},
             {'symbole': 'S', 'nom': 'Soufre', 'numero_atomique': 16, 'masse_atomique': 32.06,
              'config_electronique': '[Ne] 3s² 3p⁴', 'periode': 3, 'groupe': 16, 'categorie': 'Non-metal',
-             'date_decouverte': -2000, 'decouvreur': 'Chinois anciens', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -2000, 'decouvreur': 'Chinois anciens'},
             {'symbole': 'Cl', 'nom': 'Chlore', 'numero_atomique': 17, 'masse_atomique': 35.45,
              'config_electronique': '[Ne] 3s² 3p⁵', 'periode': 3, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 1774, 'decouvreur': 'Carl Scheele', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1774, 'decouvreur': 'Carl Scheele'},
             {'symbole': 'Ar', 'nom': 'Argon', 'numero_atomique': 18, 'masse_atomique': 39.948,
              'config_electronique': '[Ne] 3s² 3p⁶', 'periode': 3, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1894, 'decouvreur': 'Lord Rayleigh', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1894, 'decouvreur': 'Lord Rayleigh'},
             
             # Période 4
             {'symbole': 'K', 'nom': 'Potassium', 'numero_atomique': 19, 'masse_atomique': 39.098,
              'config_electronique': '[Ar] 4s¹', 'periode': 4, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1807, 'decouvreur': 'Humphry Davy', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1807, 'decouvreur': 'Humphry Davy'},
             {'symbole': 'Ca', 'nom': 'Calcium', 'numero_atomique': 20, 'masse_atomique': 40.078,
              'config_electronique': '[Ar] 4s²', 'periode': 4, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy'},
             {'symbole': 'Sc', 'nom': 'Scandium', 'numero_atomique': 21, 'masse_atomique': 44.956,
              'config_electronique': '[Ar] 3d¹ 4s²', 'periode': 4, 'groupe': 3, 'categorie': 'Métal de transition',
-             'date_decouverte': 1879, 'decouvreur': 'Lars Nilson', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1879, 'decouvreur': 'Lars Nilson'},
             {'symbole': 'Ti', 'nom': 'Titane', 'numero_atomique': 22, 'masse_atomique': 47.867,
              'config_electronique': '[Ar] 3d² 4s²', 'periode': 4, 'groupe': 4, 'categorie': 'Métal de transition',
-             'date_decouverte': 1791, 'decouvreur': 'William Gregor', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1791, 'decouvreur': 'William Gregor'},
             {'symbole': 'V', 'nom': 'Vanadium', 'numero_atomique': 23, 'masse_atomique': 50.942,
              'config_electronique': '[Ar] 3d³ 4s²', 'periode': 4, 'groupe': 5, 'categorie': 'Métal de transition',
-             'date_decouverte': 1801, 'decouvreur': 'Andrés Manuel', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1801, 'decouvreur': 'Andrés Manuel'},
             {'symbole': 'Cr', 'nom': 'Chrome', 'numero_atomique': 24, 'masse_atomique': 51.996,
              'config_electronique': '[Ar] 3d⁵ 4s¹', 'periode': 4, 'groupe': 6, 'categorie': 'Métal de transition',
-             'date_decouverte': 1797, 'decouvreur': 'Louis Vauquelin', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1797, 'decouvreur': 'Louis Vauquelin'},
             {'symbole': 'Mn', 'nom': 'Manganèse', 'numero_atomique': 25, 'masse_atomique': 54.938,
              'config_electronique': '[Ar] 3d⁵ 4s²', 'periode': 4, 'groupe': 7, 'categorie': 'Métal de transition',
-             'date_decouverte': 1774, 'decouvreur': 'Johan Gahn', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1774, 'decouvreur': 'Johan Gahn'},
             {'symbole': 'Fe', 'nom': 'Fer', 'numero_atomique': 26, 'masse_atomique': 55.845,
              'config_electronique': '[Ar] 3d⁶ 4s²', 'periode': 4, 'groupe': 8, 'categorie': 'Métal de transition',
-             'date_decouverte': -1500, 'decouvreur': 'Hittites', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -1500, 'decouvreur': 'Hittites'},
             {'symbole': 'Co', 'nom': 'Cobalt', 'numero_atomique': 27, 'masse_atomique': 58.933,
              'config_electronique': '[Ar] 3d⁷ 4s²', 'periode': 4, 'groupe': 9, 'categorie': 'Métal de transition',
-             'date_decouverte': 1735, 'decouvreur': 'Georg Brandt', 'periode_epoch': 'Renaissance'},
+             'date_decouverte': 1735, 'decouvreur': 'Georg Brandt'},
             {'symbole': 'Ni', 'nom': 'Nickel', 'numero_atomique': 28, 'masse_atomique': 58.693,
              'config_electronique': '[Ar] 3d⁸ 4s²', 'periode': 4, 'groupe': 10, 'categorie': 'Métal de transition',
-             'date_decouverte': 1751, 'decouvreur': 'Axel Cronstedt', 'periode_epoch': 'Renaissance'},
+             'date_decouverte': 1751, 'decouvreur': 'Axel Cronstedt'},
             {'symbole': 'Cu', 'nom': 'Cuivre', 'numero_atomique': 29, 'masse_atomique': 63.546,
              'config_electronique': '[Ar] 3d¹⁰ 4s¹', 'periode': 4, 'groupe': 11, 'categorie': 'Métal de transition',
-             'date_decouverte': -9000, 'decouvreur': 'Moyen-Orient', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -9000, 'decouvreur': 'Moyen-Orient'},
             {'symbole': 'Zn', 'nom': 'Zinc', 'numero_atomique': 30, 'masse_atomique': 65.38,
              'config_electronique': '[Ar] 3d¹⁰ 4s²', 'periode': 4, 'groupe': 12, 'categorie': 'Métal de transition',
-             'date_decouverte': 1000, 'decouvreur': 'Indiens', 'periode_epoch': 'Moyen-Âge'},
+             'date_decouverte': 1000, 'decouvreur': 'Indiens'},
             {'symbole': 'Ga', 'nom': 'Gallium', 'numero_atomique': 31, 'masse_atomique': 69.723,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p¹', 'periode': 4, 'groupe': 13, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1875, 'decouvreur': 'Paul Lecoq', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1875, 'decouvreur': 'Paul Lecoq'},
             {'symbole': 'Ge', 'nom': 'Germanium', 'numero_atomique': 32, 'masse_atomique': 72.63,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p²', 'periode': 4, 'groupe': 14, 'categorie': 'Métalloïde',
-             'date_decouverte': 1886, 'decouvreur': 'Clemens Winkler', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1886, 'decouvreur': 'Clemens Winkler'},
             {'symbole': 'As', 'nom': 'Arsenic', 'numero_atomique': 33, 'masse_atomique': 74.922,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p³', 'periode': 4, 'groupe': 15, 'categorie': 'Métalloïde',
-             'date_decouverte': 1250, 'decouvreur': 'Albert le Grand', 'periode_epoch': 'Moyen-Âge'},
+             'date_decouverte': 1250, 'decouvreur': 'Albert le Grand'},
             {'symbole': 'Se', 'nom': 'Sélénium', 'numero_atomique': 34, 'masse_atomique': 78.971,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p⁴', 'periode': 4, 'groupe': 16, 'categorie': 'Non-metal',
-             'date_decouverte': 1817, 'decouvreur': 'Jöns Berzelius', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1817, 'decouvreur': 'Jöns Berzelius'},
             {'symbole': 'Br', 'nom': 'Brome', 'numero_atomique': 35, 'masse_atomique': 79.904,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p⁵', 'periode': 4, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 1826, 'decouvreur': 'Antoine Balard', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1826, 'decouvreur': 'Antoine Balard'},
             {'symbole': 'Kr', 'nom': 'Krypton', 'numero_atomique': 36, 'masse_atomique': 83.798,
              'config_electronique': '[Ar] 3d¹⁰ 4s² 4p⁶', 'periode': 4, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1898, 'decouvreur': 'William Ramsay', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1898, 'decouvreur': 'William Ramsay'},
             
             # Période 5
             {'symbole': 'Rb', 'nom': 'Rubidium', 'numero_atomique': 37, 'masse_atomique': 85.468,
              'config_electronique': '[Kr] 5s¹', 'periode': 5, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1861, 'decouvreur': 'Robert Bunsen', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1861, 'decouvreur': 'Robert Bunsen'},
             {'symbole': 'Sr', 'nom': 'Strontium', 'numero_atomique': 38, 'masse_atomique': 87.62,
              'config_electronique': '[Kr] 5s²', 'periode': 5, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1790, 'decouvreur': 'Adair Crawford', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1790, 'decouvreur': 'Adair Crawford'},
             {'symbole': 'Y', 'nom': 'Yttrium', 'numero_atomique': 39, 'masse_atomique': 88.906,
              'config_electronique': '[Kr] 4d¹ 5s²', 'periode': 5, 'groupe': 3, 'categorie': 'Métal de transition',
-             'date_decouverte': 1794, 'decouvreur': 'Johan Gadolin', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1794, 'decouvreur': 'Johan Gadolin'},
             {'symbole': 'Zr', 'nom': 'Zirconium', 'numero_atomique': 40, 'masse_atomique': 91.224,
              'config_electronique': '[Kr] 4d² 5s²', 'periode': 5, 'groupe': 4, 'categorie': 'Métal de transition',
-             'date_decouverte': 1789, 'decouvreur': 'Martin Klaproth', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1789, 'decouvreur': 'Martin Klaproth'},
             {'symbole': 'Nb', 'nom': 'Niobium', 'numero_atomique': 41, 'masse_atomique': 92.906,
              'config_electronique': '[Kr] 4d⁴ 5s¹', 'periode': 5, 'groupe': 5, 'categorie': 'Métal de transition',
-             'date_decouverte': 1801, 'decouvreur': 'Charles Hatchett', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1801, 'decouvreur': 'Charles Hatchett'},
             {'symbole': 'Mo', 'nom': 'Molybdène', 'numero_atomique': 42, 'masse_atomique': 95.95,
              'config_electronique': '[Kr] 4d⁵ 5s¹', 'periode': 5, 'groupe': 6, 'categorie': 'Métal de transition',
-             'date_decouverte': 1778, 'decouvreur': 'Carl Scheele', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1778, 'decouvreur': 'Carl Scheele'},
             {'symbole': 'Tc', 'nom': 'Technétium', 'numero_atomique': 43, 'masse_atomique': 98.0,
              'config_electronique': '[Kr] 4d⁵ 5s²', 'periode': 5, 'groupe': 7, 'categorie': 'Métal de transition',
-             'date_decouverte': 1937, 'decouvreur': 'Carlo Perrier', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1937, 'decouvreur': 'Carlo Perrier'},
             {'symbole': 'Ru', 'nom': 'Ruthénium', 'numero_atomique': 44, 'masse_atomique': 101.07,
              'config_electronique': '[Kr] 4d⁷ 5s¹', 'periode': 5, 'groupe': 8, 'categorie': 'Métal de transition',
-             'date_decouverte': 1844, 'decouvreur': 'Karl Claus', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1844, 'decouvreur': 'Karl Claus'},
             {'symbole': 'Rh', 'nom': 'Rhodium', 'numero_atomique': 45, 'masse_atomique': 102.91,
              'config_electronique': '[Kr] 4d⁸ 5s¹', 'periode': 5, 'groupe': 9, 'categorie': 'Métal de transition',
-             'date_decouverte': 1803, 'decouvreur': 'William Wollaston', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1803, 'decouvreur': 'William Wollaston'},
             {'symbole': 'Pd', 'nom': 'Palladium', 'numero_atomique': 46, 'masse_atomique': 106.42,
              'config_electronique': '[Kr] 4d¹⁰', 'periode': 5, 'groupe': 10, 'categorie': 'Métal de transition',
-             'date_decouverte': 1803, 'decouvreur': 'William Wollaston', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1803, 'decouvreur': 'William Wollaston'},
             {'symbole': 'Ag', 'nom': 'Argent', 'numero_atomique': 47, 'masse_atomique': 107.87,
              'config_electronique': '[Kr] 4d¹⁰ 5s¹', 'periode': 5, 'groupe': 11, 'categorie': 'Métal de transition',
-             'date_decouverte': -3000, 'decouvreur': 'Mésopotamiens', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -3000, 'decouvreur': 'Mésopotamiens'},
             {'symbole': 'Cd', 'nom': 'Cadmium', 'numero_atomique': 48, 'masse_atomique': 112.41,
              'config_electronique': '[Kr] 4d¹⁰ 5s²', 'periode': 5, 'groupe': 12, 'categorie': 'Métal de transition',
-             'date_decouverte': 1817, 'decouvreur': 'Friedrich Stromeyer', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1817, 'decouvreur': 'Friedrich Stromeyer'},
             {'symbole': 'In', 'nom': 'Indium', 'numero_atomique': 49, 'masse_atomique': 114.82,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p¹', 'periode': 5, 'groupe': 13, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1863, 'decouvreur': 'Ferdinand Reich', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1863, 'decouvreur': 'Ferdinand Reich'},
             {'symbole': 'Sn', 'nom': 'Étain', 'numero_atomique': 50, 'masse_atomique': 118.71,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p²', 'periode': 5, 'groupe': 14, 'categorie': 'Métal pauvre',
-             'date_decouverte': -2000, 'decouvreur': 'Civilisations anciennes', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -2000, 'decouvreur': 'Civilisations anciennes'},
             {'symbole': 'Sb', 'nom': 'Antimoine', 'numero_atomique': 51, 'masse_atomique': 121.76,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p³', 'periode': 5, 'groupe': 15, 'categorie': 'Métalloïde',
-             'date_decouverte': 800, 'decouvreur': 'Jâbir ibn Hayyân', 'periode_epoch': 'Moyen-Âge'},
+             'date_decouverte': 800, 'decouvreur': 'Jâbir ibn Hayyân'},
             {'symbole': 'Te', 'nom': 'Tellure', 'numero_atomique': 52, 'masse_atomique': 127.6,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p⁴', 'periode': 5, 'groupe': 16, 'categorie': 'Métalloïde',
-             'date_decouverte': 1782, 'decouvreur': 'Franz Müller', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1782, 'decouvreur': 'Franz Müller'},
             {'symbole': 'I', 'nom': 'Iode', 'numero_atomique': 53, 'masse_atomique': 126.9,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p⁵', 'periode': 5, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 1811, 'decouvreur': 'Bernard Courtois', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1811, 'decouvreur': 'Bernard Courtois'},
             {'symbole': 'Xe', 'nom': 'Xénon', 'numero_atomique': 54, 'masse_atomique': 131.29,
              'config_electronique': '[Kr] 4d¹⁰ 5s² 5p⁶', 'periode': 5, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1898, 'decouvreur': 'William Ramsay', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1898, 'decouvreur': 'William Ramsay'},
             
             # Période 6
             {'symbole': 'Cs', 'nom': 'Césium', 'numero_atomique': 55, 'masse_atomique': 132.91,
              'config_electronique': '[Xe] 6s¹', 'periode': 6, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1860, 'decouvreur': 'Robert Bunsen', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1860, 'decouvreur': 'Robert Bunsen'},
             {'symbole': 'Ba', 'nom': 'Baryum', 'numero_atomique': 56, 'masse_atomique': 137.33,
              'config_electronique': '[Xe] 6s²', 'periode': 6, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1808, 'decouvreur': 'Humphry Davy'},
             {'symbole': 'La', 'nom': 'Lanthane', 'numero_atomique': 57, 'masse_atomique': 138.91,
              'config_electronique': '[Xe] 5d¹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1839, 'decouvreur': 'Carl Mosander', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1839, 'decouvreur': 'Carl Mosander'},
             {'symbole': 'Ce', 'nom': 'Cérium', 'numero_atomique': 58, 'masse_atomique': 140.12,
              'config_electronique': '[Xe] 4f¹ 5d¹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1803, 'decouvreur': 'Jöns Berzelius', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1803, 'decouvreur': 'Jöns Berzelius'},
             {'symbole': 'Pr', 'nom': 'Praséodyme', 'numero_atomique': 59, 'masse_atomique': 140.91,
              'config_electronique': '[Xe] 4f³ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1885, 'decouvreur': 'Carl von Welsbach', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1885, 'decouvreur': 'Carl von Welsbach'},
             {'symbole': 'Nd', 'nom': 'Néodyme', 'numero_atomique': 60, 'masse_atomique': 144.24,
              'config_electronique': '[Xe] 4f⁴ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1885, 'decouvreur': 'Carl von Welsbach', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1885, 'decouvreur': 'Carl von Welsbach'},
             {'symbole': 'Pm', 'nom': 'Prométhium', 'numero_atomique': 61, 'masse_atomique': 145.0,
              'config_electronique': '[Xe] 4f⁵ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1945, 'decouvreur': 'Jacob Marinsky', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1945, 'decouvreur': 'Jacob Marinsky'},
             {'symbole': 'Sm', 'nom': 'Samarium', 'numero_atomique': 62, 'masse_atomique': 150.36,
              'config_electronique': '[Xe] 4f⁶ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1879, 'decouvreur': 'Paul Lecoq', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1879, 'decouvreur': 'Paul Lecoq'},
             {'symbole': 'Eu', 'nom': 'Europium', 'numero_atomique': 63, 'masse_atomique': 151.96,
              'config_electronique': '[Xe] 4f⁷ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1901, 'decouvreur': 'Eugène Demarçay', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1901, 'decouvreur': 'Eugène Demarçay'},
             {'symbole': 'Gd', 'nom': 'Gadolinium', 'numero_atomique': 64, 'masse_atomique': 157.25,
              'config_electronique': '[Xe] 4f⁷ 5d¹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1880, 'decouvreur': 'Jean de Marignac', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1880, 'decouvreur': 'Jean de Marignac'},
             {'symbole': 'Tb', 'nom': 'Terbium', 'numero_atomique': 65, 'masse_atomique': 158.93,
              'config_electronique': '[Xe] 4f⁹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1843, 'decouvreur': 'Carl Mosander', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1843, 'decouvreur': 'Carl Mosander'},
             {'symbole': 'Dy', 'nom': 'Dysprosium', 'numero_atomique': 66, 'masse_atomique': 162.5,
              'config_electronique': '[Xe] 4f¹⁰ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1886, 'decouvreur': 'Paul Lecoq', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1886, 'decouvreur': 'Paul Lecoq'},
             {'symbole': 'Ho', 'nom': 'Holmium', 'numero_atomique': 67, 'masse_atomique': 164.93,
              'config_electronique': '[Xe] 4f¹¹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1878, 'decouvreur': 'Marc Delafontaine', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1878, 'decouvreur': 'Marc Delafontaine'},
             {'symbole': 'Er', 'nom': 'Erbium', 'numero_atomique': 68, 'masse_atomique': 167.26,
              'config_electronique': '[Xe] 4f¹² 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1843, 'decouvreur': 'Carl Mosander', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1843, 'decouvreur': 'Carl Mosander'},
             {'symbole': 'Tm', 'nom': 'Thulium', 'numero_atomique': 69, 'masse_atomique': 168.93,
              'config_electronique': '[Xe] 4f¹³ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1879, 'decouvreur': 'Per Teodor Cleve', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1879, 'decouvreur': 'Per Teodor Cleve'},
             {'symbole': 'Yb', 'nom': 'Ytterbium', 'numero_atomique': 70, 'masse_atomique': 173.05,
              'config_electronique': '[Xe] 4f¹⁴ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1878, 'decouvreur': 'Jean de Marignac', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1878, 'decouvreur': 'Jean de Marignac'},
             {'symbole': 'Lu', 'nom': 'Lutécium', 'numero_atomique': 71, 'masse_atomique': 174.97,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹ 6s²', 'periode': 6, 'groupe': 3, 'categorie': 'Lanthanide',
-             'date_decouverte': 1907, 'decouvreur': 'Georges Urbain', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1907, 'decouvreur': 'Georges Urbain'},
             {'symbole': 'Hf', 'nom': 'Hafnium', 'numero_atomique': 72, 'masse_atomique': 178.49,
              'config_electronique': '[Xe] 4f¹⁴ 5d² 6s²', 'periode': 6, 'groupe': 4, 'categorie': 'Métal de transition',
-             'date_decouverte': 1923, 'decouvreur': 'Dirk Coster', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1923, 'decouvreur': 'Dirk Coster'},
             {'symbole': 'Ta', 'nom': 'Tantale', 'numero_atomique': 73, 'masse_atomique': 180.95,
              'config_electronique': '[Xe] 4f¹⁴ 5d³ 6s²', 'periode': 6, 'groupe': 5, 'categorie': 'Métal de transition',
-             'date_decouverte': 1802, 'decouvreur': 'Anders Ekeberg', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1802, 'decouvreur': 'Anders Ekeberg'},
             {'symbole': 'W', 'nom': 'Tungstène', 'numero_atomique': 74, 'masse_atomique': 183.84,
              'config_electronique': '[Xe] 4f¹⁴ 5d⁴ 6s²', 'periode': 6, 'groupe': 6, 'categorie': 'Métal de transition',
-             'date_decouverte': 1783, 'decouvreur': 'Juan Elhuyar', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1783, 'decouvreur': 'Juan Elhuyar'},
             {'symbole': 'Re', 'nom': 'Rhénium', 'numero_atomique': 75, 'masse_atomique': 186.21,
              'config_electronique': '[Xe] 4f¹⁴ 5d⁵ 6s²', 'periode': 6, 'groupe': 7, 'categorie': 'Métal de transition',
-             'date_decouverte': 1925, 'decouvreur': 'Walter Noddack', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1925, 'decouvreur': 'Walter Noddack'},
             {'symbole': 'Os', 'nom': 'Osmium', 'numero_atomique': 76, 'masse_atomique': 190.23,
              'config_electronique': '[Xe] 4f¹⁴ 5d⁶ 6s²', 'periode': 6, 'groupe': 8, 'categorie': 'Métal de transition',
-             'date_decouverte': 1803, 'decouvreur': 'Smithson Tennant', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1803, 'decouvreur': 'Smithson Tennant'},
             {'symbole': 'Ir', 'nom': 'Iridium', 'numero_atomique': 77, 'masse_atomique': 192.22,
              'config_electronique': '[Xe] 4f¹⁴ 5d⁷ 6s²', 'periode': 6, 'groupe': 9, 'categorie': 'Métal de transition',
-             'date_decouverte': 1803, 'decouvreur': 'Smithson Tennant', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1803, 'decouvreur': 'Smithson Tennant'},
             {'symbole': 'Pt', 'nom': 'Platine', 'numero_atomique': 78, 'masse_atomique': 195.08,
              'config_electronique': '[Xe] 4f¹⁴ 5d⁹ 6s¹', 'periode': 6, 'groupe': 10, 'categorie': 'Métal de transition',
-             'date_decouverte': 1557, 'decouvreur': 'Julius Scaliger', 'periode_epoch': 'Renaissance'},
+             'date_decouverte': 1557, 'decouvreur': 'Julius Scaliger'},
             {'symbole': 'Au', 'nom': 'Or', 'numero_atomique': 79, 'masse_atomique': 196.97,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s¹', 'periode': 6, 'groupe': 11, 'categorie': 'Métal de transition',
-             'date_decouverte': -6000, 'decouvreur': 'Égyptiens', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -6000, 'decouvreur': 'Égyptiens'},
             {'symbole': 'Hg', 'nom': 'Mercure', 'numero_atomique': 80, 'masse_atomique': 200.59,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s²', 'periode': 6, 'groupe': 12, 'categorie': 'Métal de transition',
-             'date_decouverte': -1500, 'decouvreur': 'Chinois/Égyptiens', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -1500, 'decouvreur': 'Chinois/Égyptiens'},
             {'symbole': 'Tl', 'nom': 'Thallium', 'numero_atomique': 81, 'masse_atomique': 204.38,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p¹', 'periode': 6, 'groupe': 13, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1861, 'decouvreur': 'William Crookes', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1861, 'decouvreur': 'William Crookes'},
             {'symbole': 'Pb', 'nom': 'Plomb', 'numero_atomique': 82, 'masse_atomique': 207.2,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p²', 'periode': 6, 'groupe': 14, 'categorie': 'Métal pauvre',
-             'date_decouverte': -3000, 'decouvreur': 'Mésopotamiens', 'periode_epoch': 'Antiquité'},
+             'date_decouverte': -3000, 'decouvreur': 'Mésopotamiens'},
             {'symbole': 'Bi', 'nom': 'Bismuth', 'numero_atomique': 83, 'masse_atomique': 208.98,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p³', 'periode': 6, 'groupe': 15, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1400, 'decouvreur': 'Inconnu', 'periode_epoch': 'Moyen-Âge'},
+             'date_decouverte': 1400, 'decouvreur': 'Inconnu'},
             {'symbole': 'Po', 'nom': 'Polonium', 'numero_atomique': 84, 'masse_atomique': 209.0,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁴', 'periode': 6, 'groupe': 16, 'categorie': 'Métalloïde',
-             'date_decouverte': 1898, 'decouvreur': 'Pierre Curie', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1898, 'decouvreur': 'Pierre Curie'},
             {'symbole': 'At', 'nom': 'Astate', 'numero_atomique': 85, 'masse_atomique': 210.0,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁵', 'periode': 6, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 1940, 'decouvreur': 'Dale Corson', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1940, 'decouvreur': 'Dale Corson'},
             {'symbole': 'Rn', 'nom': 'Radon', 'numero_atomique': 86, 'masse_atomique': 222.0,
              'config_electronique': '[Xe] 4f¹⁴ 5d¹⁰ 6s² 6p⁶', 'periode': 6, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 1900, 'decouvreur': 'Friedrich Dorn', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1900, 'decouvreur': 'Friedrich Dorn'},
             
             # Période 7
             {'symbole': 'Fr', 'nom': 'Francium', 'numero_atomique': 87, 'masse_atomique': 223.0,
              'config_electronique': '[Rn] 7s¹', 'periode': 7, 'groupe': 1, 'categorie': 'Métal alcalin',
-             'date_decouverte': 1939, 'decouvreur': 'Marguerite Perey', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1939, 'decouvreur': 'Marguerite Perey'},
             {'symbole': 'Ra', 'nom': 'Radium', 'numero_atomique': 88, 'masse_atomique': 226.0,
              'config_electronique': '[Rn] 7s²', 'periode': 7, 'groupe': 2, 'categorie': 'Métal alcalino-terreux',
-             'date_decouverte': 1898, 'decouvreur': 'Pierre Curie', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1898, 'decouvreur': 'Pierre Curie'},
             {'symbole': 'Ac', 'nom': 'Actinium', 'numero_atomique': 89, 'masse_atomique': 227.0,
              'config_electronique': '[Rn] 6d¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1899, 'decouvreur': 'André Debierne', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1899, 'decouvreur': 'André Debierne'},
             {'symbole': 'Th', 'nom': 'Thorium', 'numero_atomique': 90, 'masse_atomique': 232.04,
              'config_electronique': '[Rn] 6d² 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1828, 'decouvreur': 'Jöns Berzelius', 'periode_epoch': 'Ère Spectroscopique'},
+             'date_decouverte': 1828, 'decouvreur': 'Jöns Berzelius'},
             {'symbole': 'Pa', 'nom': 'Protactinium', 'numero_atomique': 91, 'masse_atomique': 231.04,
              'config_electronique': '[Rn] 5f² 6d¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1913, 'decouvreur': 'Kasimir Fajans', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1913, 'decouvreur': 'Kasimir Fajans'},
             {'symbole': 'U', 'nom': 'Uranium', 'numero_atomique': 92, 'masse_atomique': 238.03,
              'config_electronique': '[Rn] 5f³ 6d¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1789, 'decouvreur': 'Martin Klaproth', 'periode_epoch': 'Révolution Chimique'},
+             'date_decouverte': 1789, 'decouvreur': 'Martin Klaproth'},
             {'symbole': 'Np', 'nom': 'Neptunium', 'numero_atomique': 93, 'masse_atomique': 237.0,
              'config_electronique': '[Rn] 5f⁴ 6d¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1940, 'decouvreur': 'Edwin McMillan', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1940, 'decouvreur': 'Edwin McMillan'},
             {'symbole': 'Pu', 'nom': 'Plutonium', 'numero_atomique': 94, 'masse_atomique': 244.0,
              'config_electronique': '[Rn] 5f⁶ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1940, 'decouvreur': 'Glenn Seaborg', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1940, 'decouvreur': 'Glenn Seaborg'},
             {'symbole': 'Am', 'nom': 'Américium', 'numero_atomique': 95, 'masse_atomique': 243.0,
              'config_electronique': '[Rn] 5f⁷ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1944, 'decouvreur': 'Glenn Seaborg', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1944, 'decouvreur': 'Glenn Seaborg'},
             {'symbole': 'Cm', 'nom': 'Curium', 'numero_atomique': 96, 'masse_atomique': 247.0,
              'config_electronique': '[Rn] 5f⁷ 6d¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1944, 'decouvreur': 'Glenn Seaborg', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1944, 'decouvreur': 'Glenn Seaborg'},
             {'symbole': 'Bk', 'nom': 'Berkélium', 'numero_atomique': 97, 'masse_atomique': 247.0,
              'config_electronique': '[Rn] 5f⁹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1949, 'decouvreur': 'Glenn Seaborg', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1949, 'decouvreur': 'Glenn Seaborg'},
             {'symbole': 'Cf', 'nom': 'Californium', 'numero_atomique': 98, 'masse_atomique': 251.0,
              'config_electronique': '[Rn] 5f¹⁰ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1950, 'decouvreur': 'Glenn Seaborg', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1950, 'decouvreur': 'Glenn Seaborg'},
             {'symbole': 'Es', 'nom': 'Einsteinium', 'numero_atomique': 99, 'masse_atomique': 252.0,
              'config_electronique': '[Rn] 5f¹¹ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1952, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1952, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'Fm', 'nom': 'Fermium', 'numero_atomique': 100, 'masse_atomique': 257.0,
              'config_electronique': '[Rn] 5f¹² 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1952, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1952, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'Md', 'nom': 'Mendélévium', 'numero_atomique': 101, 'masse_atomique': 258.0,
              'config_electronique': '[Rn] 5f¹³ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1955, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1955, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'No', 'nom': 'Nobélium', 'numero_atomique': 102, 'masse_atomique': 259.0,
              'config_electronique': '[Rn] 5f¹⁴ 7s²', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1958, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1958, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'Lr', 'nom': 'Lawrencium', 'numero_atomique': 103, 'masse_atomique': 262.0,
              'config_electronique': '[Rn] 5f¹⁴ 7s² 7p¹', 'periode': 7, 'groupe': 3, 'categorie': 'Actinide',
-             'date_decouverte': 1961, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1961, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'Rf', 'nom': 'Rutherfordium', 'numero_atomique': 104, 'masse_atomique': 267.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d² 7s²', 'periode': 7, 'groupe': 4, 'categorie': 'Métal de transition',
-             'date_decouverte': 1964, 'decouvreur': 'Georgy Flerov', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1964, 'decouvreur': 'Georgy Flerov'},
             {'symbole': 'Db', 'nom': 'Dubnium', 'numero_atomique': 105, 'masse_atomique': 268.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d³ 7s²', 'periode': 7, 'groupe': 5, 'categorie': 'Métal de transition',
-             'date_decouverte': 1967, 'decouvreur': 'Georgy Flerov', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1967, 'decouvreur': 'Georgy Flerov'},
             {'symbole': 'Sg', 'nom': 'Seaborgium', 'numero_atomique': 106, 'masse_atomique': 269.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d⁴ 7s²', 'periode': 7, 'groupe': 6, 'categorie': 'Métal de transition',
-             'date_decouverte': 1974, 'decouvreur': 'Albert Ghiorso', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1974, 'decouvreur': 'Albert Ghiorso'},
             {'symbole': 'Bh', 'nom': 'Bohrium', 'numero_atomique': 107, 'masse_atomique': 270.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d⁵ 7s²', 'periode': 7, 'groupe': 7, 'categorie': 'Métal de transition',
-             'date_decouverte': 1981, 'decouvreur': 'Peter Armbruster', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1981, 'decouvreur': 'Peter Armbruster'},
             {'symbole': 'Hs', 'nom': 'Hassium', 'numero_atomique': 108, 'masse_atomique': 270.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d⁶ 7s²', 'periode': 7, 'groupe': 8, 'categorie': 'Métal de transition',
-             'date_decouverte': 1984, 'decouvreur': 'Peter Armbruster', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1984, 'decouvreur': 'Peter Armbruster'},
             {'symbole': 'Mt', 'nom': 'Meitnérium', 'numero_atomique': 109, 'masse_atomique': 278.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d⁷ 7s²', 'periode': 7, 'groupe': 9, 'categorie': 'Métal de transition',
-             'date_decouverte': 1982, 'decouvreur': 'Peter Armbruster', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1982, 'decouvreur': 'Peter Armbruster'},
             {'symbole': 'Ds', 'nom': 'Darmstadtium', 'numero_atomique': 110, 'masse_atomique': 281.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d⁹ 7s¹', 'periode': 7, 'groupe': 10, 'categorie': 'Métal de transition',
-             'date_decouverte': 1994, 'decouvreur': 'Sigurd Hofmann', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1994, 'decouvreur': 'Sigurd Hofmann'},
             {'symbole': 'Rg', 'nom': 'Roentgenium', 'numero_atomique': 111, 'masse_atomique': 282.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s¹', 'periode': 7, 'groupe': 11, 'categorie': 'Métal de transition',
-             'date_decouverte': 1994, 'decouvreur': 'Sigurd Hofmann', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1994, 'decouvreur': 'Sigurd Hofmann'},
             {'symbole': 'Cn', 'nom': 'Copernicium', 'numero_atomique': 112, 'masse_atomique': 285.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s²', 'periode': 7, 'groupe': 12, 'categorie': 'Métal de transition',
-             'date_decouverte': 1996, 'decouvreur': 'Sigurd Hofmann', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1996, 'decouvreur': 'Sigurd Hofmann'},
             {'symbole': 'Nh', 'nom': 'Nihonium', 'numero_atomique': 113, 'masse_atomique': 286.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p¹', 'periode': 7, 'groupe': 13, 'categorie': 'Métal pauvre',
-             'date_decouverte': 2004, 'decouvreur': 'RIKEN', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 2004, 'decouvreur': 'RIKEN'},
             {'symbole': 'Fl', 'nom': 'Flérovium', 'numero_atomique': 114, 'masse_atomique': 289.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p²', 'periode': 7, 'groupe': 14, 'categorie': 'Métal pauvre',
-             'date_decouverte': 1999, 'decouvreur': 'JINR', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 1999, 'decouvreur': 'JINR'},
             {'symbole': 'Mc', 'nom': 'Moscovium', 'numero_atomique': 115, 'masse_atomique': 290.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p³', 'periode': 7, 'groupe': 15, 'categorie': 'Métal pauvre',
-             'date_decouverte': 2004, 'decouvreur': 'JINR', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 2004, 'decouvreur': 'JINR'},
             {'symbole': 'Lv', 'nom': 'Livermorium', 'numero_atomique': 116, 'masse_atomique': 293.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p⁴', 'periode': 7, 'groupe': 16, 'categorie': 'Métal pauvre',
-             'date_decouverte': 2000, 'decouvreur': 'JINR', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 2000, 'decouvreur': 'JINR'},
             {'symbole': 'Ts', 'nom': 'Tennessine', 'numero_atomique': 117, 'masse_atomique': 294.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p⁵', 'periode': 7, 'groupe': 17, 'categorie': 'Halogène',
-             'date_decouverte': 2010, 'decouvreur': 'JINR', 'periode_epoch': 'Période Moderne'},
+             'date_decouverte': 2010, 'decouvreur': 'JINR'},
             {'symbole': 'Og', 'nom': 'Oganesson', 'numero_atomique': 118, 'masse_atomique': 294.0,
              'config_electronique': '[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p⁶', 'periode': 7, 'groupe': 18, 'categorie': 'Gaz noble',
-             'date_decouverte': 2006, 'decouvreur': 'JINR', 'periode_epoch': 'Période Moderne'}
+             'date_decouverte': 2006, 'decouvreur': 'JINR'}
         ]
     
     def define_complete_spectral_rgb_data(self):
@@ -574,10 +2159,156 @@ class CompletePeriodicTableDashboard:
             'Pu': {'rgb': (150, 100, 150), 'longueur_onde_principale': 476.0, 'raies': ['476.0 nm']}
         }
     
+    def define_nuclide_data(self):
+        """Définit les nucléides (masse isotopique en u, abondance naturelle en %, demi-vie en s)
+        
+        La table intégrée est partielle (une centaine de nucléides : isotopes naturels des
+        éléments courants et chaîne de l'uranium 238). La table complète des ~3 300 nucléides
+        connus n'est pas fournie avec le dépôt : elle doit être placée à côté du script dans un
+        fichier `nuclides.csv` (mêmes colonnes), qui remplace alors la table intégrée.
+        """
+        if os.path.exists(NUCLIDE_DATA_FILE):
+            return load_nuclide_file(NUCLIDE_DATA_FILE, os.stat(NUCLIDE_DATA_FILE).st_mtime_ns)
+        
+        an, jour, minute = constants.Julian_year, constants.day, constants.minute
+        return [
+            {'symbole': 'H', 'nombre_masse': 1, 'masse_isotopique': 1.00782503, 'abondance': 99.9885, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'H', 'nombre_masse': 2, 'masse_isotopique': 2.01410178, 'abondance': 0.0115, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'H', 'nombre_masse': 3, 'masse_isotopique': 3.01604928, 'abondance': 0.0, 'demi_vie_s': 12.32 * an, 'descendant': 'He-3'},
+            {'symbole': 'He', 'nombre_masse': 3, 'masse_isotopique': 3.01602932, 'abondance': 0.000134, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'He', 'nombre_masse': 4, 'masse_isotopique': 4.00260325, 'abondance': 99.999866, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Li', 'nombre_masse': 6, 'masse_isotopique': 6.01512289, 'abondance': 7.59, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Li', 'nombre_masse': 7, 'masse_isotopique': 7.01600344, 'abondance': 92.41, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Be', 'nombre_masse': 9, 'masse_isotopique': 9.0121831, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Be', 'nombre_masse': 10, 'masse_isotopique': 10.0135347, 'abondance': 0.0, 'demi_vie_s': 1.387e6 * an, 'descendant': 'B-10'},
+            {'symbole': 'B', 'nombre_masse': 10, 'masse_isotopique': 10.0129369, 'abondance': 19.9, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'B', 'nombre_masse': 11, 'masse_isotopique': 11.0093054, 'abondance': 80.1, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'C', 'nombre_masse': 12, 'masse_isotopique': 12.0, 'abondance': 98.93, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'C', 'nombre_masse': 13, 'masse_isotopique': 13.00335484, 'abondance': 1.07, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'C', 'nombre_masse': 14, 'masse_isotopique': 14.00324199, 'abondance': 0.0, 'demi_vie_s': 5700 * an, 'descendant': 'N-14'},
+            {'symbole': 'N', 'nombre_masse': 14, 'masse_isotopique': 14.003074, 'abondance': 99.636, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'N', 'nombre_masse': 15, 'masse_isotopique': 15.0001089, 'abondance': 0.364, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'O', 'nombre_masse': 16, 'masse_isotopique': 15.99491462, 'abondance': 99.757, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'O', 'nombre_masse': 17, 'masse_isotopique': 16.99913176, 'abondance': 0.038, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'O', 'nombre_masse': 18, 'masse_isotopique': 17.99915961, 'abondance': 0.205, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'F', 'nombre_masse': 19, 'masse_isotopique': 18.99840316, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ne', 'nombre_masse': 20, 'masse_isotopique': 19.99244018, 'abondance': 90.48, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ne', 'nombre_masse': 21, 'masse_isotopique': 20.99384669, 'abondance': 0.27, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ne', 'nombre_masse': 22, 'masse_isotopique': 21.99138511, 'abondance': 9.25, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Na', 'nombre_masse': 22, 'masse_isotopique': 21.99443742, 'abondance': 0.0, 'demi_vie_s': 2.6018 * an, 'descendant': 'Ne-22'},
+            {'symbole': 'Na', 'nombre_masse': 23, 'masse_isotopique': 22.98976928, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Mg', 'nombre_masse': 24, 'masse_isotopique': 23.9850417, 'abondance': 78.99, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Mg', 'nombre_masse': 25, 'masse_isotopique': 24.98583698, 'abondance': 10.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Mg', 'nombre_masse': 26, 'masse_isotopique': 25.98259297, 'abondance': 11.01, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Al', 'nombre_masse': 27, 'masse_isotopique': 26.98153853, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Si', 'nombre_masse': 28, 'masse_isotopique': 27.97692653, 'abondance': 92.223, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Si', 'nombre_masse': 29, 'masse_isotopique': 28.97649466, 'abondance': 4.685, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Si', 'nombre_masse': 30, 'masse_isotopique': 29.97377014, 'abondance': 3.092, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'P', 'nombre_masse': 31, 'masse_isotopique': 30.973762, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'P', 'nombre_masse': 32, 'masse_isotopique': 31.97390764, 'abondance': 0.0, 'demi_vie_s': 14.268 * jour, 'descendant': 'S-32'},
+            {'symbole': 'S', 'nombre_masse': 32, 'masse_isotopique': 31.97207117, 'abondance': 94.99, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'S', 'nombre_masse': 33, 'masse_isotopique': 32.97145891, 'abondance': 0.75, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'S', 'nombre_masse': 34, 'masse_isotopique': 33.967867, 'abondance': 4.25, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'S', 'nombre_masse': 36, 'masse_isotopique': 35.96708071, 'abondance': 0.01, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cl', 'nombre_masse': 35, 'masse_isotopique': 34.96885268, 'abondance': 75.76, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cl', 'nombre_masse': 37, 'masse_isotopique': 36.9659026, 'abondance': 24.24, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ar', 'nombre_masse': 36, 'masse_isotopique': 35.96754511, 'abondance': 0.3336, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ar', 'nombre_masse': 38, 'masse_isotopique': 37.96273211, 'abondance': 0.0629, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ar', 'nombre_masse': 40, 'masse_isotopique': 39.96238312, 'abondance': 99.6035, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'K', 'nombre_masse': 39, 'masse_isotopique': 38.96370649, 'abondance': 93.2581, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'K', 'nombre_masse': 40, 'masse_isotopique': 39.96399817, 'abondance': 0.0117, 'demi_vie_s': 1.248e9 * an, 'descendant': 'Ca-40'},
+            {'symbole': 'K', 'nombre_masse': 41, 'masse_isotopique': 40.96182526, 'abondance': 6.7302, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 40, 'masse_isotopique': 39.96259086, 'abondance': 96.941, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 42, 'masse_isotopique': 41.95861783, 'abondance': 0.647, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 43, 'masse_isotopique': 42.95876644, 'abondance': 0.135, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 44, 'masse_isotopique': 43.95548156, 'abondance': 2.086, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 46, 'masse_isotopique': 45.953689, 'abondance': 0.004, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ca', 'nombre_masse': 48, 'masse_isotopique': 47.95252276, 'abondance': 0.187, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Fe', 'nombre_masse': 54, 'masse_isotopique': 53.93960899, 'abondance': 5.845, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Fe', 'nombre_masse': 56, 'masse_isotopique': 55.93493633, 'abondance': 91.754, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Fe', 'nombre_masse': 57, 'masse_isotopique': 56.93539284, 'abondance': 2.119, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Fe', 'nombre_masse': 58, 'masse_isotopique': 57.93327443, 'abondance': 0.282, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Co', 'nombre_masse': 59, 'masse_isotopique': 58.93319429, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Co', 'nombre_masse': 60, 'masse_isotopique': 59.9338163, 'abondance': 0.0, 'demi_vie_s': 5.2714 * an, 'descendant': 'Ni-60'},
+            {'symbole': 'Ni', 'nombre_masse': 58, 'masse_isotopique': 57.93534241, 'abondance': 68.077, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ni', 'nombre_masse': 60, 'masse_isotopique': 59.93078588, 'abondance': 26.223, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ni', 'nombre_masse': 61, 'masse_isotopique': 60.93105557, 'abondance': 1.1399, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ni', 'nombre_masse': 62, 'masse_isotopique': 61.92834537, 'abondance': 3.6346, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ni', 'nombre_masse': 64, 'masse_isotopique': 63.92796682, 'abondance': 0.9255, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cu', 'nombre_masse': 63, 'masse_isotopique': 62.92959772, 'abondance': 69.15, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cu', 'nombre_masse': 65, 'masse_isotopique': 64.9277897, 'abondance': 30.85, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Zn', 'nombre_masse': 64, 'masse_isotopique': 63.92914201, 'abondance': 49.17, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Zn', 'nombre_masse': 66, 'masse_isotopique': 65.92603381, 'abondance': 27.73, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Zn', 'nombre_masse': 67, 'masse_isotopique': 66.92712775, 'abondance': 4.04, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Zn', 'nombre_masse': 68, 'masse_isotopique': 67.92484455, 'abondance': 18.45, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Zn', 'nombre_masse': 70, 'masse_isotopique': 69.9253192, 'abondance': 0.61, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Sr', 'nombre_masse': 84, 'masse_isotopique': 83.9134191, 'abondance': 0.56, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Sr', 'nombre_masse': 86, 'masse_isotopique': 85.9092606, 'abondance': 9.86, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Sr', 'nombre_masse': 87, 'masse_isotopique': 86.9088775, 'abondance': 7.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Sr', 'nombre_masse': 88, 'masse_isotopique': 87.9056125, 'abondance': 82.58, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Sr', 'nombre_masse': 90, 'masse_isotopique': 89.9077279, 'abondance': 0.0, 'demi_vie_s': 28.79 * an, 'descendant': 'Y-90'},
+            {'symbole': 'Y', 'nombre_masse': 89, 'masse_isotopique': 88.9058403, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Y', 'nombre_masse': 90, 'masse_isotopique': 89.9071439, 'abondance': 0.0, 'demi_vie_s': 64.05 * 3600, 'descendant': 'Zr-90'},
+            {'symbole': 'Zr', 'nombre_masse': 90, 'masse_isotopique': 89.9046977, 'abondance': 51.45, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ag', 'nombre_masse': 107, 'masse_isotopique': 106.9050916, 'abondance': 51.839, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Ag', 'nombre_masse': 109, 'masse_isotopique': 108.9047553, 'abondance': 48.161, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'I', 'nombre_masse': 127, 'masse_isotopique': 126.9044719, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'I', 'nombre_masse': 131, 'masse_isotopique': 130.9061263, 'abondance': 0.0, 'demi_vie_s': 8.0252 * jour, 'descendant': 'Xe-131'},
+            {'symbole': 'Xe', 'nombre_masse': 131, 'masse_isotopique': 130.9050841, 'abondance': 21.232, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cs', 'nombre_masse': 133, 'masse_isotopique': 132.905452, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Cs', 'nombre_masse': 137, 'masse_isotopique': 136.9070895, 'abondance': 0.0, 'demi_vie_s': 30.08 * an, 'descendant': 'Ba-137'},
+            {'symbole': 'Ba', 'nombre_masse': 137, 'masse_isotopique': 136.9058271, 'abondance': 11.232, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Au', 'nombre_masse': 197, 'masse_isotopique': 196.9665688, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 196, 'masse_isotopique': 195.965833, 'abondance': 0.15, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 198, 'masse_isotopique': 197.9667686, 'abondance': 9.97, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 199, 'masse_isotopique': 198.9682806, 'abondance': 16.87, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 200, 'masse_isotopique': 199.9683266, 'abondance': 23.1, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 201, 'masse_isotopique': 200.9703028, 'abondance': 13.18, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 202, 'masse_isotopique': 201.9706434, 'abondance': 29.86, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Hg', 'nombre_masse': 204, 'masse_isotopique': 203.973494, 'abondance': 6.87, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Pb', 'nombre_masse': 204, 'masse_isotopique': 203.973044, 'abondance': 1.4, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Pb', 'nombre_masse': 206, 'masse_isotopique': 205.9744657, 'abondance': 24.1, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Pb', 'nombre_masse': 207, 'masse_isotopique': 206.9758973, 'abondance': 22.1, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Pb', 'nombre_masse': 208, 'masse_isotopique': 207.9766525, 'abondance': 52.4, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Pb', 'nombre_masse': 210, 'masse_isotopique': 209.9841889, 'abondance': 0.0, 'demi_vie_s': 22.2 * an, 'descendant': 'Bi-210'},
+            {'symbole': 'Pb', 'nombre_masse': 214, 'masse_isotopique': 213.9998035, 'abondance': 0.0, 'demi_vie_s': 26.8 * minute, 'descendant': 'Bi-214'},
+            {'symbole': 'Bi', 'nombre_masse': 209, 'masse_isotopique': 208.9803991, 'abondance': 100.0, 'demi_vie_s': None, 'descendant': None},
+            {'symbole': 'Bi', 'nombre_masse': 210, 'masse_isotopique': 209.9841207, 'abondance': 0.0, 'demi_vie_s': 5.012 * jour, 'descendant': 'Po-210'},
+            {'symbole': 'Bi', 'nombre_masse': 214, 'masse_isotopique': 213.9987115, 'abondance': 0.0, 'demi_vie_s': 19.9 * minute, 'descendant': 'Po-214'},
+            {'symbole': 'Po', 'nombre_masse': 210, 'masse_isotopique': 209.9828741, 'abondance': 0.0, 'demi_vie_s': 138.376 * jour, 'descendant': 'Pb-206'},
+            {'symbole': 'Po', 'nombre_masse': 214, 'masse_isotopique': 213.9952014, 'abondance': 0.0, 'demi_vie_s': 164.3e-6, 'descendant': 'Pb-210'},
+            {'symbole': 'Po', 'nombre_masse': 218, 'masse_isotopique': 218.0089735, 'abondance': 0.0, 'demi_vie_s': 3.098 * minute, 'descendant': 'Pb-214'},
+            {'symbole': 'Rn', 'nombre_masse': 222, 'masse_isotopique': 222.0175782, 'abondance': 0.0, 'demi_vie_s': 3.8235 * jour, 'descendant': 'Po-218'},
+            {'symbole': 'Ra', 'nombre_masse': 226, 'masse_isotopique': 226.0254103, 'abondance': 0.0, 'demi_vie_s': 1600 * an, 'descendant': 'Rn-222'},
+            {'symbole': 'Th', 'nombre_masse': 230, 'masse_isotopique': 230.0331341, 'abondance': 0.0, 'demi_vie_s': 7.538e4 * an, 'descendant': 'Ra-226'},
+            {'symbole': 'Th', 'nombre_masse': 232, 'masse_isotopique': 232.0380558, 'abondance': 100.0, 'demi_vie_s': 1.405e10 * an, 'descendant': None},
+            {'symbole': 'Th', 'nombre_masse': 234, 'masse_isotopique': 234.0436014, 'abondance': 0.0, 'demi_vie_s': 24.1 * jour, 'descendant': 'Pa-234'},
+            {'symbole': 'Pa', 'nombre_masse': 234, 'masse_isotopique': 234.0433072, 'abondance': 0.0, 'demi_vie_s': 1.159 * minute, 'descendant': 'U-234'},
+            {'symbole': 'U', 'nombre_masse': 234, 'masse_isotopique': 234.0409523, 'abondance': 0.0054, 'demi_vie_s': 2.455e5 * an, 'descendant': 'Th-230'},
+            {'symbole': 'U', 'nombre_masse': 235, 'masse_isotopique': 235.0439301, 'abondance': 0.7204, 'demi_vie_s': 7.04e8 * an, 'descendant': None},
+            {'symbole': 'U', 'nombre_masse': 238, 'masse_isotopique': 238.0507884, 'abondance': 99.2742, 'demi_vie_s': 4.468e9 * an, 'descendant': 'Th-234'},
+            {'symbole': 'Pu', 'nombre_masse': 239, 'masse_isotopique': 239.0521636, 'abondance': 0.0, 'demi_vie_s': 2.411e4 * an, 'descendant': 'U-235'},
+            {'symbole': 'Am', 'nombre_masse': 241, 'masse_isotopique': 241.0568293, 'abondance': 0.0, 'demi_vie_s': 432.6 * an, 'descendant': None}
+        ]
+    
+    def simulate_spectrum(self, element_symb, temperature=DEFAULT_TEMPERATURE):
+        """Spectre d'émission simulé d'un élément sur le domaine visible (longueurs d'onde, intensités)"""
+        return self.emission_spectra.spectrum(element_symb, temperature)
+    
+    def temperature_slider(self, key):
+        """Curseur de température aligné sur la grille des spectres précalculés"""
+        temperatures = self.emission_spectra.temperatures
+        return st.slider("Température d'émission (K):", int(temperatures[0]), int(temperatures[-1]),
+                         DEFAULT_TEMPERATURE, step=int(temperatures[1] - temperatures[0]), key=key)
+    
+    def element_label(self, element_symb):
+        """Libellé « symbole - nom » précalculé dans le catalogue"""
+        return self.catalog.labels[self.catalog.index_by_symbol[element_symb]]
+
     def get_element_rgb(self, element_symb):
         """Retourne la couleur RGB d'un élément"""
-        if element_symb in self.spectral_data:
-            return self.spectral_data[element_symb]['rgb']
+        if element_symb in self.catalog.spectra:
+            return self.catalog.spectra[element_symb].rgb
         else:
             # Couleur par défaut basée sur la catégorie
             category_colors = {
@@ -592,9 +2323,10 @@ class CompletePeriodicTableDashboard:
                 'Lanthanide': (255, 150, 150),  # Rose
                 'Actinide': (150, 255, 150)  # Vert clair
             }
-            element = next((e for e in self.elements_data if e['symbole'] == element_symb), None)
-            if element and element['categorie'] in category_colors:
-                return category_colors[element['categorie']]
+            index = self.catalog.index_by_symbol.get(element_symb)
+            element = self.catalog.elements[index] if index is not None else None
+            if element and element.categorie in category_colors:
+                return category_colors[element.categorie]
             return (200, 200, 200)  # Gris par défaut
     
     def display_header(self):
@@ -609,73 +2341,77 @@ class CompletePeriodicTableDashboard:
         </div>
         """, unsafe_allow_html=True)
     
-    def create_complete_periodic_table(self):
+    def create_complete_periodic_table(self, coloring='Spectre RGB', active=None, layout=GRID_LAYOUTS[0]):
         """Crée une vue complète du tableau périodique"""
         st.markdown('<h3 class="section-header">🧪 TABLEAU PÉRIODIQUE COMPLET CLASSÉ PAR DATE DE DÉCOUVERTE</h3>', 
                    unsafe_allow_html=True)
         
-        # Configuration du tableau périodique
-        periodic_layout = [
-            [1,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   2   ],
-            [3,   4,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   5,   6,   7,   8,   9,   10  ],
-            [11,  12,  0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   13,  14,  15,  16,  17,  18  ],
-            [19,  20,  21,  22,  23,  24,  25,  26,  27,  28,  29,  30,  31,  32,  33,  34,  35,  36  ],
-            [37,  38,  39,  40,  41,  42,  43,  44,  45,  46,  47,  48,  49,  50,  51,  52,  53,  54  ],
-            [55,  56,  57,  72,  73,  74,  75,  76,  77,  78,  79,  80,  81,  82,  83,  84,  85,  86  ],
-            [87,  88,  89,  104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118 ],
-            [0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0,   0   ],
-            [0,   0,   'Lanthanides', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0,   0,   58,  59,  60,  61,  62,  63,  64,  65,  66,  67,  68,  69,  70,  71,  0,   0   ],
-            [0,   0,   'Actinides', 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-            [0,   0,   90,  91,  92,  93,  94,  95,  96,  97,  98,  99,  100, 101, 102, 103, 0,   0   ]
-        ]
+        if active is None:
+            active = np.ones(len(self.catalog), dtype=bool)
         
-        # Créer le tableau périodique
-        for row in periodic_layout:
-            cols = st.columns(18)
-            for i, atomic_number in enumerate(row):
-                with cols[i]:
-                    if atomic_number == 0:
-                        st.write("")  # Case vide
-                    elif isinstance(atomic_number, str):
-                        st.markdown(f"<div style='text-align: center; font-weight: bold;'>{atomic_number}</div>", 
-                                   unsafe_allow_html=True)
-                    else:
-                        element = next((e for e in self.elements_data if e['numero_atomique'] == atomic_number), None)
-                        if element:
-                            rgb = self.get_element_rgb(element['symbole'])
-                            rgb_hex = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
-                            text_color = 'white' if sum(rgb) < 450 else 'black'
-                            
-                            category_class = f"category-{element['categorie'].lower().replace(' ', '-').replace('é', 'e')}"
-                            
-                            st.markdown(f"""
-                            <div class="periodic-cell {category_class}" 
-                                 style="background-color: {rgb_hex}; color: {text_color};"
-                                 title="{element['nom']} - Découvert en {element['date_decouverte'] if element['date_decouverte'] > 0 else 'Antiquité'}">
-                                <strong>{element['symbole']}</strong><br>
-                                <small>{element['numero_atomique']}</small>
-                            </div>
-                            """, unsafe_allow_html=True)
+        # Un seul envoi par catalogue, coloration et disposition ; les filtres ne transmettent
+        # que le masque des éléments actifs. Survol, mise en évidence et sélection restent
+        # côté navigateur
+        payload_version = '-'.join([self.catalog_version, coloring, layout])
+        payload = build_grid_payload(payload_version, self.catalog, self.grid_colors(coloring), layout)
+        periodic_grid(version=payload_version, payload=payload, active=active.astype(np.uint8).tolist(),
+                      key='periodic_grid', on_change=open_in_explorer, default=None)
+    
+    def grid_colors(self, coloring):
+        """Couleurs RGB des cases du tableau selon le mode de coloration"""
+        if coloring == 'Spectre RGB':
+            return [self.get_element_rgb(e.symbole) for e in self.catalog.elements]
+        values = {
+            'Électrons de valence': self.catalog.valence_electrons,
+            'Électrons non appariés': self.catalog.unpaired_electrons
+        }[coloring]
+        scaled = values / max(int(values.max()), 1)
+        return [px.colors.unlabel_rgb(color) for color in px.colors.sample_colorscale('Viridis', scaled)]
+    
+    def filter_mask(self, controls):
+        """Masque des éléments retenus par les filtres de la sidebar"""
+        epochs = np.array([e.periode_epoch for e in self.catalog.elements], dtype=object)
+        categories = np.array([e.categorie for e in self.catalog.elements], dtype=object)
+        low, high = controls['valence_range']
+        return (np.isin(epochs, controls['epoch_filter'])
+                & np.isin(categories, controls['category_filter'])
+                & electron_filter_mask(self.catalog.electron_occupancy, controls['electron_filter'])
+                & (self.catalog.valence_electrons >= low) & (self.catalog.valence_electrons <= high))
     
-    def create_epoch_timeline(self):
+    def create_epoch_timeline(self, granularity='Époques historiques', start_year=0):
         """Crée une frise chronologique interactive"""
         st.markdown('<h3 class="section-header">📅 FRISE CHRONOLOGIQUE COMPLÈTE DES DÉCOUVERTES</h3>', 
                    unsafe_allow_html=True)
         
+        if st.toggle("Animer les découvertes au fil du temps"):
+            # Animation entièrement côté navigateur : aucune réexécution par image
+            colors = []
+            for element in self.catalog.elements:
+                rgb = self.get_element_rgb(element.symbole)
+                colors.append(f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})')
+            fig = build_discovery_animation(self.catalog_version, self.catalog, colors)
+            st.plotly_chart(fig, use_container_width=True)
+            return
+        
+        # Regroupement des dates à la granularité choisie
+        epochs = self.catalog.regroup_epochs(granularity, start_year, skip_empty=True)
+        epoch_names = np.empty(len(self.catalog), dtype=object)
+        for epoch in epochs:
+            epoch_names[epoch.indices] = epoch.nom
+        
         # Préparer les données pour la timeline
         timeline_data = []
-        for element in self.elements_data:
-            if element['date_decouverte'] > -10000:
-                rgb = self.get_element_rgb(element['symbole'])
+        for i, element in enumerate(self.catalog.elements):
+            if element.date_decouverte > -10000:
+                rgb = self.get_element_rgb(element.symbole)
                 timeline_data.append({
-                    'Element': element['symbole'],
-                    'Nom': element['nom'],
-                    'Année': max(0, element['date_decouverte']),
-                    'Découvreur': element['decouvreur'],
-                    'Période': element['periode_epoch'],
+                    'Element': element.symbole,
+                    'Nom': element.nom,
+                    'Année': max(0, element.date_decouverte),
+                    'Découvreur': element.decouvreur,
+                    'Période': epoch_names[i],
                     'Couleur': f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})',
-                    'Numéro': element['numero_atomique']
+                    'Numéro': element.numero_atomique
                 })
         
         df_timeline = pd.DataFrame(timeline_data)
@@ -687,7 +2423,8 @@ class CompletePeriodicTableDashboard:
                         color='Période',
                         hover_data=['Nom', 'Découvreur', 'Element'],
                         title="Chronologie Complète des Découvertes des Éléments",
-                        color_discrete_sequence=['#F5DEB3', '#DEB887', '#F4A460', '#CD853F', '#D2691E', '#A0522D'])
+                        category_orders={'Période': [epoch.nom for epoch in epochs]},
+                        color_discrete_map={epoch.nom: epoch.couleur for epoch in epochs})
         
         fig.update_traces(marker=dict(size=8, line=dict(width=1, color='DarkSlateGrey')),
                          selector=dict(mode='markers'))
@@ -695,18 +2432,18 @@ class CompletePeriodicTableDashboard:
         
         st.plotly_chart(fig, use_container_width=True)
     
-    def create_epoch_overview(self):
+    def create_epoch_overview(self, granularity='Époques historiques', start_year=0):
         """Affiche une vue détaillée par époque historique"""
         st.markdown('<h3 class="section-header">🏛️ VUE DÉTAILLÉE PAR ÉPOQUE HISTORIQUE</h3>', 
                    unsafe_allow_html=True)
         
-        for epoch in self.epochs_data:
-            elements_epoch = [e for e in self.elements_data if e['periode_epoch'] == epoch['nom']]
+        for epoch in self.catalog.regroup_epochs(granularity, start_year, skip_empty=True):
+            elements_epoch = [self.catalog.elements[i] for i in epoch.indices]
             
             st.markdown(f"""
-            <div class="epoch-{epoch['nom'].lower().replace(' ', '').replace('é', 'e')}">
-                <h3>{epoch['nom']} ({epoch['periode']})</h3>
-                <p>{epoch['description']} - {len(elements_epoch)} éléments</p>
+            <div class="epoch-{epoch.nom.lower().replace(' ', '').replace('é', 'e')}" style="background-color: {epoch.couleur};">
+                <h3>{epoch.nom} ({epoch.periode})</h3>
+                <p>{epoch.description} - {len(elements_epoch)} éléments</p>
             </div>
             """, unsafe_allow_html=True)
             
@@ -718,18 +2455,18 @@ class CompletePeriodicTableDashboard:
                     if i + j < len(elements_epoch):
                         element = elements_epoch[i + j]
                         with cols[j]:
-                            rgb = self.get_element_rgb(element['symbole'])
+                            rgb = self.get_element_rgb(element.symbole)
                             rgb_hex = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
                             
                             st.markdown(f"""
                             <div class="discovery-card">
                                 <div style="text-align: center;">
-                                    <h4>{element['symbole']}</h4>
+                                    <h4>{element.symbole}</h4>
                                     <div class="rgb-spectrum" style="background: linear-gradient(90deg, {rgb_hex}80, {rgb_hex});"></div>
-                                    <strong>{element['nom']}</strong><br>
-                                    <small>N° {element['numero_atomique']}</small><br>
-                                    <small>Découvert en {element['date_decouverte'] if element['date_decouverte'] > 0 else 'Antiquité'}</small><br>
-                                    <small><em>{element['decouvreur'][:25]}{'...' if len(element['decouvreur']) > 25 else ''}</em></small>
+                                    <strong>{element.nom}</strong><br>
+                                    <small>N° {element.numero_atomique}</small><br>
+                                    <small>Découvert en {element.date_decouverte if element.date_decouverte > 0 else 'Antiquité'}</small><br>
+                                    <small><em>{element.decouvreur[:25]}{'...' if len(element.decouvreur) > 25 else ''}</em></small>
                                 </div>
                             </div>
                             """, unsafe_allow_html=True)
@@ -745,23 +2482,23 @@ class CompletePeriodicTableDashboard:
         
         with tab1:
             # Analyse par catégorie
-            categories = list(set([e['categorie'] for e in self.elements_data]))
+            categories = list(set([e.categorie for e in self.catalog.elements]))
             
             for category in categories:
-                elements_cat = [e for e in self.elements_data if e['categorie'] == category]
+                elements_cat = [e for e in self.catalog.elements if e.categorie == category]
                 st.subheader(f"{category} ({len(elements_cat)} éléments)")
                 
                 cols = st.columns(6)
                 for i, element in enumerate(elements_cat[:6]):
                     with cols[i]:
-                        rgb = self.get_element_rgb(element['symbole'])
+                        rgb = self.get_element_rgb(element.symbole)
                         rgb_hex = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
                         
                         st.markdown(f"""
                         <div style="text-align: center; padding: 10px; background-color: {rgb_hex}30; border-radius: 5px;">
-                            <strong>{element['symbole']}</strong><br>
+                            <strong>{element.symbole}</strong><br>
                             <div style="width: 100%; height: 20px; background: linear-gradient(90deg, {rgb_hex}80, {rgb_hex}); border-radius: 3px; margin: 5px 0;"></div>
-                            <small>{element['nom']}</small>
+                            <small>{element.nom}</small>
                         </div>
                         """, unsafe_allow_html=True)
                 
@@ -770,23 +2507,23 @@ class CompletePeriodicTableDashboard:
                         additional_cols = st.columns(6)
                         for i, element in enumerate(elements_cat[6:]):
                             with additional_cols[i % 6]:
-                                rgb = self.get_element_rgb(element['symbole'])
+                                rgb = self.get_element_rgb(element.symbole)
                                 rgb_hex = f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
                                 
                                 st.markdown(f"""
                                 <div style="text-align: center; padding: 5px; background-color: {rgb_hex}30; border-radius: 3px; margin: 2px;">
-                                    <strong>{element['symbole']}</strong><br>
-                                    <small>{element['nom']}</small>
+                                    <strong>{element.symbole}</strong><br>
+                                    <small>{element.nom}</small>
                                 </div>
                                 """, unsafe_allow_html=True)
         
         with tab2:
             # Analyse par époque
-            for epoch in self.epochs_data:
-                elements_epoch = [e for e in self.elements_data if e['periode_epoch'] == epoch['nom']]
+            for epoch in self.catalog.epochs:
+                elements_epoch = [self.catalog.elements[i] for i in epoch.indices]
                 
                 # Calculer la couleur moyenne de l'époque
-                rgb_values = [self.get_element_rgb(e['symbole']) for e in elements_epoch]
+                rgb_values = [self.get_element_rgb(e.symbole) for e in elements_epoch]
                 if rgb_values:
                     avg_rgb = tuple(int(np.mean([rgb[i] for rgb in rgb_values])) for i in range(3))
                     avg_hex = f'#{avg_rgb[0]:02x}{avg_rgb[1]:02x}{avg_rgb[2]:02x}'
@@ -795,8 +2532,8 @@ class CompletePeriodicTableDashboard:
                     <div style="display: flex; align-items: center; margin: 10px 0; padding: 15px; background: linear-gradient(135deg, {avg_hex}20, {avg_hex}50); border-radius: 10px;">
                         <div style="width: 60px; height: 60px; background-color: {avg_hex}; border-radius: 5px; margin-right: 15px; border: 2px solid white;"></div>
                         <div>
-                            <h4>{epoch['nom']} ({epoch['periode']})</h4>
-                            <p>{epoch['description']} - {len(elements_epoch)} éléments</p>
+                            <h4>{epoch.nom} ({epoch.periode})</h4>
+                            <p>{epoch.description} - {len(elements_epoch)} éléments</p>
                         </div>
                     </div>
                     """, unsafe_allow_html=True)
@@ -807,49 +2544,47 @@ class CompletePeriodicTableDashboard:
             
             selected_elements = st.multiselect(
                 "Sélectionnez des éléments à comparer:",
-                [f"{e['symbole']} - {e['nom']}" for e in self.elements_data],
-                default=['H - Hydrogène', 'Na - Sodium', 'Hg - Mercure', 'Ne - Néon']
+                self.symbols,
+                default=['H', 'Na', 'Hg', 'Ne'],
+                format_func=self.element_label
             )
             
+            temperature = self.temperature_slider('comparison_temperature')
+            
             if selected_elements:
-                fig = go.Figure()
-                
-                for element_str in selected_elements:
-                    element_symb = element_str.split(' - ')[0]
-                    element = next(e for e in self.elements_data if e['symbole'] == element_symb)
-                    rgb = self.get_element_rgb(element_symb)
-                    rgb_hex = f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})'
-                    
-                    # Spectre simulé
-                    lambda_range = np.linspace(380, 780, 500)
-                    spectre = np.zeros_like(lambda_range)
-                    
-                    if element_symb in self.spectral_data:
-                        raie_principale = self.spectral_data[element_symb]['longueur_onde_principale']
-                        if 380 <= raie_principale <= 780:
-                            spectre += 0.8 * np.exp(-0.5 * ((lambda_range - raie_principale) / 15)**2)
-                    
-                    # Ajouter des raies secondaires simulées
-                    for i in range(3):
-                        raie_pos = 400 + i * 100
-                        if 380 <= raie_pos <= 780:
-                            spectre += 0.3 * np.exp(-0.5 * ((lambda_range - raie_pos) / 10)**2)
-                    
-                    fig.add_trace(go.Scatter(
-                        x=lambda_range, y=spectre,
-                        mode='lines',
-                        name=f"{element_symb} - {element['nom']}",
-                        line=dict(color=rgb_hex, width=3)
-                    ))
-                
-                fig.update_layout(
-                    title="Comparaison des Spectres Simulés",
-                    xaxis=dict(title="Longueur d'onde (nm)"),
-                    yaxis=dict(title="Intensité relative"),
-                    height=400
-                )
-                
+                symbols = tuple(selected_elements)
+                fig = session_cached(('comparaison', self.catalog_version, symbols, temperature),
+                                     lambda: self.build_comparison_figure(symbols, temperature))
+                st.plotly_chart(fig, use_container_width=True)
+
+            # Similarité de toutes les paires, calculée une fois par version et température
+            st.subheader("Similarité Spectrale (cosinus)")
+            temperature_index = self.emission_spectra.temperature_index(temperature)
+            symbols, similarity = load_spectral_similarity(self.catalog_version, temperature_index,
+                                                           self.emission_spectra)
+
+            col1, col2 = st.columns([2, 1])
+            with col2:
+                reference = st.selectbox("Éléments les plus similaires à:", symbols, format_func=self.element_label)
+                index = symbols.index(reference)
+                neighbours, scores = most_similar(similarity, index)
+                st.dataframe(pd.DataFrame({
+                    'Élément': [self.element_label(symbols[i]) for i in neighbours],
+                    'Similarité': scores
+                }), hide_index=True, use_container_width=True,
+                    column_config={'Similarité': st.column_config.ProgressColumn(min_value=0, max_value=1, format="%.3f")})
+
+            with col1:
+                # Regroupement et carte bornés : au-delà de MAX_CLUSTERED_SPECTRA, voisinage de la référence
+                bounded = len(symbols) > MAX_CLUSTERED_SPECTRA
+                subset = similarity_neighbourhood(similarity, index)
+                fig = session_cached(
+                    ('similarite', self.catalog_version, temperature_index, reference if bounded else None),
+                    lambda: self.build_similarity_figure(symbols, similarity, subset))
                 st.plotly_chart(fig, use_container_width=True)
+                if bounded:
+                    st.caption(f"{len(subset)} spectres les plus proches de {reference} "
+                               f"sur {len(symbols)} (carte limitée à {MAX_CLUSTERED_SPECTRA})")
     
     def create_element_explorer(self):
         """Explorateur détaillé des éléments"""
@@ -859,10 +2594,23 @@ class CompletePeriodicTableDashboard:
         col1, col2 = st.columns([1, 3])
         
         with col1:
-            element_choice = st.selectbox("Choisir un élément:", 
-                                        [f"{e['symbole']} - {e['nom']}" for e in self.elements_data])
-            element_symb = element_choice.split(' - ')[0]
-            element_data = next(e for e in self.elements_data if e['symbole'] == element_symb)
+            query = st.text_input("Rechercher un élément:",
+                                  placeholder="Symbole, nom, numéro, découvreur, longueur d'onde...")
+            options = self.symbols
+            if query:
+                results = self.search_index.search(query)
+                if results:
+                    options = [e.symbole for e in results]
+                else:
+                    st.info("Aucun élément ne correspond à cette recherche")
+            
+            # Élément éventuellement ouvert depuis la grille interactive
+            requested = st.session_state.get('explorer_element')
+            index = options.index(requested) if requested in options else 0
+            
+            element_symb = st.selectbox("Choisir un élément:", options, index=index,
+                                        format_func=self.element_label)
+            element_data = self.catalog.elements[self.catalog.index_by_symbol[element_symb]]
         
         with col2:
             rgb = self.get_element_rgb(element_symb)
@@ -871,7 +2619,7 @@ class CompletePeriodicTableDashboard:
             
             st.markdown(f"""
             <div style="text-align: center; padding: 20px; background: linear-gradient(135deg, {rgb_hex}20, {rgb_hex}50); border-radius: 10px; border: 2px solid {rgb_hex};">
-                <h2>{element_data['symbole']} - {element_data['nom']}</h2>
+                <h2>{element_data.symbole} - {element_data.nom}</h2>
                 <div style="display: flex; justify-content: center; align-items: center; margin: 20px 0;">
                     <div style="width: 120px; height: 120px; background-color: {rgb_hex}; border-radius: 50%; border: 4px solid white; box-shadow: 0 4px 8px rgba(0,0,0,0.3);"></div>
                 </div>
@@ -886,12 +2634,12 @@ class CompletePeriodicTableDashboard:
             st.markdown(f"""
             <div class="discovery-card">
                 <h4>📜 Données Historiques</h4>
-                <strong>Numéro atomique:</strong> {element_data['numero_atomique']}<br>
-                <strong>Date de découverte:</strong> {element_data['date_decouverte'] if element_data['date_decouverte'] > 0 else 'Antiquité'}<br>
-                <strong>Découvreur:</strong> {element_data['decouvreur']}<br>
-                <strong>Période historique:</strong> {element_data['periode_epoch']}<br>
-                <strong>Période:</strong> {element_data['periode']}<br>
-                <strong>Groupe:</strong> {element_data['groupe']}
+                <strong>Numéro atomique:</strong> {element_data.numero_atomique}<br>
+                <strong>Date de découverte:</strong> {element_data.date_decouverte if element_data.date_decouverte > 0 else 'Antiquité'}<br>
+                <strong>Découvreur:</strong> {element_data.decouvreur}<br>
+                <strong>Période historique:</strong> {element_data.periode_epoch}<br>
+                <strong>Période:</strong> {element_data.periode}<br>
+                <strong>Groupe:</strong> {element_data.groupe}
             </div>
             """, unsafe_allow_html=True)
         
@@ -899,21 +2647,21 @@ class CompletePeriodicTableDashboard:
             st.markdown(f"""
             <div class="discovery-card">
                 <h4>⚛️ Propriétés Atomiques</h4>
-                <strong>Masse atomique:</strong> {element_data['masse_atomique']} u<br>
-                <strong>Configuration électronique:</strong> {element_data['config_electronique']}<br>
-                <strong>Catégorie:</strong> {element_data['categorie']}
+                <strong>Masse atomique:</strong> {element_data.masse_atomique} u<br>
+                <strong>Configuration électronique:</strong> {element_data.config_electronique}<br>
+                <strong>Catégorie:</strong> {element_data.categorie}
             </div>
             """, unsafe_allow_html=True)
             
-            if element_symb in self.spectral_data:
-                spectral_info = self.spectral_data[element_symb]
+            if element_symb in self.catalog.spectra:
+                spectral_info = self.catalog.spectra[element_symb]
                 st.markdown(f"""
                 <div class="discovery-card">
                     <h4>🌈 Données Spectrales</h4>
                     <strong>Couleur RGB:</strong> {rgb}<br>
-                    <strong>Longueur d'onde principale:</strong> {spectral_info['longueur_onde_principale']} nm<br>
+                    <strong>Longueur d'onde principale:</strong> {spectral_info.longueur_onde_principale} nm<br>
                     <strong>Raies caractéristiques:</strong><br>
-                    {', '.join(spectral_info['raies'])}
+                    {', '.join(str(raie) for raie in spectral_info.raies)}
                 </div>
                 """, unsafe_allow_html=True)
         
@@ -925,45 +2673,307 @@ class CompletePeriodicTableDashboard:
             </div>
             """, unsafe_allow_html=True)
             
-            lambda_range = np.linspace(380, 780, 500)
-            spectre = np.zeros_like(lambda_range)
-            
-            if element_symb in self.spectral_data:
-                raie_principale = self.spectral_data[element_symb]['longueur_onde_principale']
-                if 380 <= raie_principale <= 780:
-                    spectre += 0.8 * np.exp(-0.5 * ((lambda_range - raie_principale) / 10)**2)
-                
-                # Ajouter des raies secondaires
-                for i in range(2):
-                    raie_pos = raie_principale + (i+1)*40 * (-1)**i
-                    if 380 <= raie_pos <= 780:
-                        spectre += 0.4 * np.exp(-0.5 * ((lambda_range - raie_pos) / 8)**2)
+            temperature = self.temperature_slider('explorer_temperature')
+            fig = session_cached(('spectre', self.catalog_version, element_symb, temperature),
+                                 lambda: self.build_spectrum_figure(element_symb, temperature))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        self.create_similar_elements_panel(element_symb)
+        self.create_live_spectrum_panel(element_symb)
+        self.create_isotope_panel(element_data)
+    
+    def build_comparison_figure(self, symbols, temperature):
+        """Figure superposant les spectres simulés de plusieurs éléments"""
+        fig = go.Figure()
+        
+        for element_symb in symbols:
+            element = self.catalog.elements[self.catalog.index_by_symbol[element_symb]]
+            rgb = self.get_element_rgb(element_symb)
+            rgb_hex = f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})'
             
-            # Correction : utiliser rgba() au lieu de concaténer hex
-            rgba_fill = f'rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.25)'
+            # Spectre simulé : lecture dans la grille précalculée
+            lambda_range, spectre = self.simulate_spectrum(element_symb, temperature)
             
-            fig = go.Figure()
             fig.add_trace(go.Scatter(
                 x=lambda_range, y=spectre,
                 mode='lines',
-                line=dict(color=f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})', width=3),
-                name=f"Spectre {element_symb}",
-                fill='tozeroy',
-                fillcolor=rgba_fill  # Utiliser rgba() au lieu de concaténer
+                name=f"{element_symb} - {element.nom}",
+                line=dict(color=rgb_hex, width=3)
             ))
+        
+        fig.update_layout(
+            title=f"Comparaison des Spectres Simulés à {temperature} K",
+            xaxis=dict(title="Longueur d'onde (nm)"),
+            yaxis=dict(title="Intensité relative"),
+            height=400
+        )
+        return fig
+
+    def build_similarity_figure(self, symbols, similarity, subset):
+        """Carte de similarité d'un sous-ensemble borné, regroupé hiérarchiquement"""
+        ordered = subset[clustered_order(similarity, subset)]
+        labels = [symbols[i] for i in ordered]
+        fig = px.imshow(np.asarray(similarity[np.ix_(ordered, ordered)]), x=labels, y=labels,
+                        color_continuous_scale='Viridis', zmin=0, zmax=1,
+                        labels=dict(color="Similarité"))
+        fig.update_layout(height=600, title="Spectres regroupés hiérarchiquement")
+        return fig
+
+    def build_spectrum_figure(self, element_symb, temperature):
+        """Figure du spectre simulé d'un élément à une température"""
+        rgb = self.get_element_rgb(element_symb)
+        lambda_range, spectre = self.simulate_spectrum(element_symb, temperature)
+        
+        # Correction : utiliser rgba() au lieu de concaténer hex
+        rgba_fill = f'rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, 0.25)'
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=lambda_range, y=spectre,
+            mode='lines',
+            line=dict(color=f'rgb({rgb[0]}, {rgb[1]}, {rgb[2]})', width=3),
+            name=f"Spectre {element_symb}",
+            fill='tozeroy',
+            fillcolor=rgba_fill  # Utiliser rgba() au lieu de concaténer
+        ))
+        
+        fig.update_layout(
+            title=f"Spectre simulé de {element_symb} à {temperature} K",
+            xaxis=dict(title="Longueur d'onde (nm)"),
+            yaxis=dict(title="Intensité relative"),
+            height=250,
+            showlegend=False,
+            plot_bgcolor='rgba(0,0,0,0)',
+            paper_bgcolor='rgba(0,0,0,0)'
+        )
+        return fig
+    
+    def create_similar_elements_panel(self, element_symb):
+        """Éléments aux descripteurs proches : k plus proches voisins ou recherche par rayon"""
+        st.markdown('<h4>🧭 Éléments semblables</h4>', unsafe_allow_html=True)
+        
+        index = load_descriptor_index(self.catalog_version, self.catalog, self.grid_colors('Spectre RGB'))
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            mode = st.radio("Requête:", ["k plus proches voisins", "Rayon"], key='similar_mode')
+            if mode == "Rayon":
+                radius = st.slider("Rayon (écarts-types):", 0.5, 6.0, 3.0, step=0.25, key='similar_radius')
+            else:
+                k = st.slider("Nombre de voisins:", 1, 20, 5, key='similar_k')
+        
+        with col2:
+            start = time.perf_counter()
+            i = self.catalog.index_by_symbol[element_symb]
+            neighbours, distances = index.within(i, radius) if mode == "Rayon" else index.nearest(i, k)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            
+            if len(neighbours) == 0:
+                st.info("Aucun élément dans ce rayon")
+            else:
+                descriptors = element_descriptors(self.catalog, self.grid_colors('Spectre RGB'))[neighbours]
+                table = pd.DataFrame(descriptors, columns=DESCRIPTOR_FEATURES)
+                table.insert(0, 'Distance', distances)
+                table.insert(0, 'Élément', [self.catalog.labels[j] for j in neighbours])
+                st.dataframe(table.drop(columns=['Rouge', 'Vert', 'Bleu']), hide_index=True,
+                             use_container_width=True,
+                             column_config={'Distance': st.column_config.NumberColumn(format="%.2f")})
+            st.caption(f"Descripteurs centrés-réduits, index KD-tree de {len(index)} éléments ; "
+                       f"requête en {elapsed_ms:.2f} ms")
+    
+    def create_live_spectrum_panel(self, element_symb):
+        """Spectre mesuré en direct (socket, tube nommé, fichier ou simulateur local)"""
+        with st.expander("📡 Spectromètre en direct"):
+            st.caption("Sources déclarées sur le serveur (une trame d'intensités par ligne) ou simulateur")
+            sources = configured_live_sources()
+            col1, col2, col3 = st.columns([3, 1, 1])
+            with col1:
+                uri = sources[st.selectbox("Source des trames:", list(sources), key='live_source')]
+            with col2:
+                match = st.checkbox("Identifier l'élément", value=True, key='live_match')
+            with col3:
+                refresh_hz = st.slider("Rafraîchissement (Hz):", 1, LIVE_MAX_REFRESH_HZ, 2, key='live_refresh')
+            
+            connection = st.session_state.get('live_connection')
+            if connection is None:
+                if st.button("Connecter", key='live_connect'):
+                    connection = (uri, match, element_symb, self.catalog_version)
+                    st.session_state['live_connection'] = connection
+            elif st.button("Déconnecter", key='live_disconnect'):
+                open_live_source.clear()
+                connection = st.session_state['live_connection'] = None
+            
+            if connection is not None:
+                # Seul ce fragment est réexécuté, à fréquence plafonnée
+                st.fragment(render_live_spectrum, run_every=1 / refresh_hz)(connection, self.emission_spectra)
+    
+    def create_isotope_panel(self, element_data):
+        """Isotopes d'un élément et évolution des désintégrations d'un échantillon"""
+        st.markdown('<h4>☢️ Isotopes et Désintégrations</h4>', unsafe_allow_html=True)
+        
+        nuclides = self.catalog.nuclides
+        if not os.path.exists(NUCLIDE_DATA_FILE):
+            st.caption(f"Table intégrée partielle ({len(nuclides)} nucléides) : placer un fichier "
+                       "nuclides.csv à côté du script pour la table complète")
+        isotopes = nuclides.for_element(element_data.numero_atomique)
+        if len(isotopes) == 0:
+            st.info(f"Aucun isotope répertorié pour {element_data.nom}")
+            return
+        
+        col1, col2 = st.columns([2, 3])
+        
+        with col1:
+            st.dataframe(pd.DataFrame({
+                'Nucléide': nuclides.labels[isotopes],
+                'Masse (u)': nuclides.masse[isotopes],
+                'Abondance (%)': nuclides.abondance[isotopes] * 100,
+                'Demi-vie': [format_half_life(t) for t in nuclides.demi_vie[isotopes]]
+            }), hide_index=True, use_container_width=True)
             
+            weighted_mass = nuclides.weighted_masses()[element_data.numero_atomique]
+            if np.isfinite(weighted_mass):
+                st.metric("Masse pondérée par les abondances", f"{weighted_mass:.4f} u",
+                          f"{weighted_mass - element_data.masse_atomique:+.4f} u vs catalogue")
+        
+        radioactive = [label for label in nuclides.labels[isotopes]
+                       if nuclides.decay_constant[nuclides.index_by_label[label]] > 0]
+        with col2:
+            if not radioactive:
+                st.info("Tous les isotopes répertoriés sont stables")
+                return
+            
+            sub1, sub2, sub3 = st.columns(3)
+            with sub1:
+                parent = st.selectbox("Nucléide parent:", radioactive)
+            with sub2:
+                sample_mass = st.number_input("Masse de l'échantillon (g):", min_value=1e-12,
+                                              value=1.0, format="%g")
+            with sub3:
+                horizon = st.select_slider("Horizon (années):", options=[1, 10, 100, 10**3, 10**4, 10**6, 10**8, 10**10],
+                                           value=10**4)
+            
+            times, labels, activities = compute_decay_evolution(
+                self.catalog_version, self.catalog, parent, sample_mass, horizon)
+            
+            fig = go.Figure()
+            for label, activity in zip(labels, activities):
+                if activity.max() > 0:
+                    fig.add_trace(go.Scatter(x=times / constants.Julian_year, y=activity, mode='lines', name=label))
             fig.update_layout(
-                title=f"Spectre simulé de {element_symb}",
-                xaxis=dict(title="Longueur d'onde (nm)"),
-                yaxis=dict(title="Intensité relative"),
-                height=250,
-                showlegend=False,
-                plot_bgcolor='rgba(0,0,0,0)',
-                paper_bgcolor='rgba(0,0,0,0)'
+                title=f"Activité de la chaîne issue de {parent}",
+                xaxis=dict(title="Temps (années)", type='log'),
+                yaxis=dict(title="Activité (Bq)", type='log'),
+                height=350
             )
-            
             st.plotly_chart(fig, use_container_width=True)
     
+    def create_molar_mass_calculator(self):
+        """Calculateur de masses molaires et de fractions massiques"""
+        st.markdown('<h3 class="section-header">⚖️ CALCULATEUR DE MASSE MOLAIRE</h3>', 
+                   unsafe_allow_html=True)
+        
+        calculator = self.catalog.formula_calculator
+        tab1, tab2 = st.tabs(["Formules", "Fichier CSV"])
+        
+        with tab1:
+            text = st.text_area("Formules (une par ligne):",
+                                "H2O\nCuSO4·5H2O\nCa(OH)2\nK4[Fe(CN)6]\nSO4^2-\nFe^3+", height=180)
+            formulas = [line.strip() for line in text.splitlines() if line.strip()]
+            if formulas:
+                results = calculator.molar_masses(formulas)
+                st.dataframe(results, hide_index=True, use_container_width=True,
+                             column_config={'masse_molaire': st.column_config.NumberColumn(
+                                 "Masse molaire (g/mol)", format="%.4f")})
+                
+                st.markdown("**Fractions massiques**")
+                st.dataframe(calculator.mass_fractions(formulas).style.format("{:.2%}", na_rep="-"),
+                             use_container_width=True)
+        
+        with tab2:
+            uploaded = st.file_uploader("Fichier CSV contenant une colonne de formules:", type=['csv'])
+            if uploaded is not None:
+                columns = pd.read_csv(uploaded, nrows=0).columns.tolist()
+                column = st.selectbox("Colonne des formules:", columns)
+                if st.button("Calculer les masses molaires"):
+                    uploaded.seek(0)
+                    path = molar_mass_output_file(uploaded.file_id, column)
+                    n_rows = 0
+                    progress = st.empty()
+                    # Traitement par blocs écrits dans un fichier temporaire : le calcul ne garde qu'un
+                    # bloc en mémoire. Le fichier téléversé est, lui, conservé en mémoire par Streamlit
+                    # (taille limitée par l'option server.maxUploadSize).
+                    with open(path, 'w', newline='', encoding='utf-8') as output:
+                        for chunk in calculator.stream_csv(uploaded, column, output=output):
+                            n_rows += len(chunk)
+                            progress.caption(f"{n_rows} formules traitées")
+                    st.session_state['molar_mass_output'] = (uploaded.file_id, column, path)
+                
+                result = st.session_state.get('molar_mass_output')
+                if result and result[:2] == (uploaded.file_id, column) and os.path.exists(result[2]):
+                    def read_output(path=result[2]):
+                        with open(path, 'rb') as f:
+                            return f.read()
+                    # Fichier lu uniquement au moment du téléchargement
+                    st.download_button("Télécharger les résultats", read_output,
+                                       file_name=f"masses_molaires_{uploaded.name}", mime='text/csv')
+    
+    def create_trends_analysis(self, active=None):
+        """Tendances des propriétés : ajustements par groupe ou période, résidus et corrélations"""
+        st.markdown('<h3 class="section-header">📈 TENDANCES DES PROPRIÉTÉS</h3>',
+                   unsafe_allow_html=True)
+
+        if active is None:
+            active = np.ones(len(self.catalog), dtype=bool)
+        if active.sum() < 3:
+            st.warning("Au moins trois éléments doivent être retenus par les filtres.")
+            return
+
+        col1, col2 = st.columns(2)
+        with col1:
+            property_name = st.selectbox("Propriété:", list(TREND_PROPERTIES))
+        with col2:
+            grouping_name = st.selectbox("Ajustement par:", list(TREND_GROUPINGS))
+
+        # Un calcul par version du catalogue, jeu de filtres, propriété et regroupement
+        filter_key = hashlib.sha1(np.packbits(active).tobytes()).hexdigest()[:8]
+        summary, details = compute_property_trends(self.catalog_version, filter_key, self.catalog, active,
+                                                   property_name, grouping_name)
+
+        tab1, tab2, tab3 = st.tabs(["Ajustements", "Résidus", "Corrélations de rang"])
+
+        with tab1:
+            fig = session_cached(('tendances', self.catalog_version, filter_key, property_name, grouping_name),
+                                 lambda: build_trend_figure(details, property_name, grouping_name))
+            st.plotly_chart(fig, use_container_width=True)
+
+            st.dataframe(summary, hide_index=True, use_container_width=True,
+                         column_config={'p-valeur': st.column_config.NumberColumn(format="%.2e")})
+
+        with tab2:
+            fig = px.scatter(details, x='numero_atomique', y='residu_std', hover_name='symbole',
+                             color=details['aberrant'].map({True: 'Aberrant', False: 'Normal'}),
+                             color_discrete_map={'Aberrant': '#D2691E', 'Normal': '#8B4513'},
+                             labels={'numero_atomique': 'Numéro atomique', 'residu_std': 'Résidu standardisé',
+                                     'color': ''})
+            for bound in (-TREND_OUTLIER_THRESHOLD, TREND_OUTLIER_THRESHOLD):
+                fig.add_hline(y=bound, line_dash='dash', line_color='gray')
+            fig.update_layout(height=400)
+            st.plotly_chart(fig, use_container_width=True)
+
+            outliers = details[details['aberrant']]
+            if len(outliers):
+                st.markdown(f"**{len(outliers)} valeur(s) aberrante(s)** (|résidu standardisé| > {TREND_OUTLIER_THRESHOLD:g})")
+                st.dataframe(outliers.drop(columns='aberrant'), hide_index=True, use_container_width=True)
+            else:
+                st.info("Aucune valeur aberrante pour ces filtres.")
+
+        with tab3:
+            groups = summary[summary[grouping_name] != 'Tous']
+            fig = px.bar(groups, x=grouping_name, y='Spearman ρ', color='p-valeur',
+                         color_continuous_scale='Viridis_r', range_y=[-1, 1])
+            fig.update_layout(height=400, title=f"Corrélation de rang entre Z et {property_name.lower()}")
+            st.plotly_chart(fig, use_container_width=True)
+
     def create_sidebar(self):
         """Crée la sidebar avec les contrôles"""
         st.sidebar.markdown("## 🎛️ NAVIGATION COMPLÈTE")
@@ -972,33 +2982,68 @@ class CompletePeriodicTableDashboard:
         st.sidebar.markdown("### 🧭 Vues Principales")
         section = st.sidebar.radio("Choisir la vue:", 
                                  ["Tableau Périodique", "Frise Chronologique", "Vue par Époque", 
-                                  "Analyse Spectrale", "Explorateur d'Éléments"])
+                                  "Analyse Spectrale", "Explorateur d'Éléments",
+                                  "Calculateur de Masse Molaire", "Tendances"],
+                                 key='section')
         
         # Filtres
         st.sidebar.markdown("### 🔍 Filtres Avancés")
         epoch_filter = st.sidebar.multiselect(
             "Filtrer par époque:",
-            [epoch['nom'] for epoch in self.epochs_data],
-            default=[epoch['nom'] for epoch in self.epochs_data]
+            [epoch.nom for epoch in self.catalog.epochs],
+            default=[epoch.nom for epoch in self.catalog.epochs]
         )
         
         category_filter = st.sidebar.multiselect(
             "Filtrer par catégorie:",
-            list(set([e['categorie'] for e in self.elements_data])),
-            default=list(set([e['categorie'] for e in self.elements_data]))
+            list(set([e.categorie for e in self.catalog.elements])),
+            default=list(set([e.categorie for e in self.catalog.elements]))
         )
         
+        electron_filter = st.sidebar.selectbox("Filtrer par structure électronique:", list(ELECTRON_FILTERS))
+        max_valence = int(self.catalog.valence_electrons.max())
+        valence_range = st.sidebar.slider("Électrons de valence:", 0, max_valence, (0, max_valence))
+        
         # Options d'affichage
         st.sidebar.markdown("### 🎨 Options d'Affichage")
         show_spectra = st.sidebar.checkbox("Afficher les spectres simulés", value=True)
         group_by_epoch = st.sidebar.checkbox("Grouper par époque historique", value=True)
+        grid_coloring = st.sidebar.selectbox("Coloration du tableau:", GRID_COLORINGS)
+        grid_layout = st.sidebar.selectbox("Disposition du tableau:", GRID_LAYOUTS)
+        epoch_granularity = st.sidebar.selectbox("Regroupement chronologique:", list(EPOCH_GRANULARITIES))
+        start_year = 0
+        if EPOCH_GRANULARITIES[epoch_granularity] is not None:
+            start_year = st.sidebar.number_input("Année de départ:", min_value=EPOCH_START_YEARS[0],
+                                                 max_value=EPOCH_START_YEARS[1],
+                                                 value=1700, step=EPOCH_GRANULARITIES[epoch_granularity])
+        
+        # Diagnostics
+        with st.sidebar.expander("🧮 Diagnostics mémoire"):
+            st.caption(f"Version du catalogue : {self.catalog_version}")
+            if st.button("Comparer dicts et enregistrements"):
+                st.dataframe(compare_record_memory(self.catalog_version, self.catalog),
+                             hide_index=True)
+            
+            registry = session_cache_registry()
+            st.markdown("**Caches par session**")
+            st.caption(f"Budget {registry.session_budget / 2**20:.0f} Mo par session, "
+                       f"{registry.global_budget / 2**20:.0f} Mo au total, "
+                       f"libérés après {registry.idle_seconds // 60:.0f} min d'inactivité")
+            st.dataframe(registry.report(), hide_index=True,
+                         column_config={'Mémoire (Mo)': st.column_config.NumberColumn(format="%.2f")})
         
         return {
             'section': section,
             'epoch_filter': epoch_filter,
             'category_filter': category_filter,
+            'electron_filter': electron_filter,
+            'valence_range': valence_range,
+            'grid_coloring': grid_coloring,
+            'grid_layout': grid_layout,
             'show_spectra': show_spectra,
-            'group_by_epoch': group_by_epoch
+            'group_by_epoch': group_by_epoch,
+            'epoch_granularity': epoch_granularity,
+            'start_year': int(start_year)
         }
     
     def run_dashboard(self):
@@ -1009,21 +3054,29 @@ class CompletePeriodicTableDashboard:
         # Header
         self.display_header()
         
+        # Regroupement chronologique choisi dans la sidebar
+        grouping = (controls['epoch_granularity'], controls['start_year'])
+        
         # Navigation principale
         if controls['section'] == "Tableau Périodique":
-            self.create_complete_periodic_table()
-            self.create_epoch_overview()
+            self.create_complete_periodic_table(controls['grid_coloring'], self.filter_mask(controls),
+                                                controls['grid_layout'])
+            self.create_epoch_overview(*grouping)
         elif controls['section'] == "Frise Chronologique":
-            self.create_epoch_timeline()
+            self.create_epoch_timeline(*grouping)
             self.create_spectral_analysis()
         elif controls['section'] == "Vue par Époque":
-            self.create_epoch_overview()
+            self.create_epoch_overview(*grouping)
             self.create_spectral_analysis()
         elif controls['section'] == "Analyse Spectrale":
             self.create_spectral_analysis()
             self.create_element_explorer()
         elif controls['section'] == "Explorateur d'Éléments":
             self.create_element_explorer()
+        elif controls['section'] == "Calculateur de Masse Molaire":
+            self.create_molar_mass_calculator()
+        elif controls['section'] == "Tendances":
+            self.create_trends_analysis(self.filter_mask(controls))
         
         # Footer
         st.markdown("---")